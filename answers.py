@@ -0,0 +1,150 @@
+""" -- Advent of Code --
+Persistent (on-disk) cache of puzzle answers.
+
+Some parts take minutes to solve (e.g. 2022 Day 16 and Day 19), and there is no
+point in solving them again if neither the input nor the solver has changed.
+Answers are therefore stored by a key combining:
+- the SHA-256 of the input file bytes;
+- the SHA-256 of the solver source code, i.e. `puzzle.py` **and** any other module
+  of this repository it imports, directly or not (see `local_modules`);
+- year, day, part, and any extra argument passed to the part function.
+This way, whenever the input or the code changes, the key changes too, and the
+stale answer is never looked up again (eventually being evicted).
+
+The cache is an [`sqlite3`](https://docs.python.org/3/library/sqlite3.html) database
+(built-in, and safe to share among the worker processes of `runner.py`),
+bounded in size with a Least Recently Used eviction policy.
+
+Used by `runner.py` and by the `conftest.py` of the test suite; set the
+`AOC_NO_CACHE` environment variable to disable it altogether.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from time import time
+from types import ModuleType
+from typing import Any, Optional, Union
+
+ROOT = Path(__file__).parent
+CACHE_FILE = ROOT / ".answers.sqlite"
+MAX_ENTRIES = int(os.environ.get("AOC_CACHE_SIZE", 1024))
+
+MISS = object()  # answers can legitimately be `None`
+
+
+def enabled() -> bool:
+    return not os.environ.get("AOC_NO_CACHE")
+
+
+def input_digest(filepath: Union[str, Path]) -> str:
+    return hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+
+
+def imported_names(source: Path) -> set[str]:
+    """Names of all the modules imported by source, anywhere (e.g. within functions)"""
+    names = set()
+    for node in ast.walk(ast.parse(source.read_bytes())):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)  # imported names may be submodules, too
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def local_file(name: str) -> Optional[Path]:
+    """Source file of the module name, if it belongs to this repository"""
+    filepath = getattr(sys.modules.get(name), "__file__", None)
+    if filepath is None:
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        filepath = spec.origin if spec is not None and spec.has_location else None
+    if filepath is None or not filepath.endswith(".py"):
+        return None
+    filepath = Path(filepath).resolve()
+    if not filepath.is_relative_to(ROOT) or "site-packages" in filepath.parts:
+        return None
+    return filepath
+
+
+def local_modules(module: ModuleType) -> set[Path]:
+    """Source files (within this repository) of module and of all the modules it
+    uses, transitively"""
+    sources, pending = set(), [Path(module.__file__).resolve()]
+    while pending:
+        source = pending.pop()
+        if source in sources:
+            continue
+        sources.add(source)
+        pending.extend(filter(None, map(local_file, imported_names(source))))
+    return sources
+
+
+def solver_digest(module: ModuleType) -> str:
+    sha = hashlib.sha256()
+    for source in sorted(local_modules(module)):
+        sha.update(source.read_bytes())
+    return sha.hexdigest()
+
+
+def cache_key(year: str, day: str, part: int, *digests: str, extras: str = "") -> str:
+    return hashlib.sha256(
+        "|".join((year, day, str(part), *digests, extras)).encode()
+    ).hexdigest()
+
+
+class AnswerCache:
+    def __init__(
+        self, filepath: Union[str, Path] = CACHE_FILE, max_entries: int = MAX_ENTRIES
+    ) -> None:
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(filepath, timeout=30)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS answers "
+                "(key TEXT PRIMARY KEY, answer TEXT, last_used REAL)"
+            )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def __enter__(self) -> "AnswerCache":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._db.close()
+
+    def get(self, key: str) -> Any:
+        row = self._db.execute(
+            "SELECT answer FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return MISS
+        with self._db:
+            self._db.execute(
+                "UPDATE answers SET last_used = ? WHERE key = ?", (time(), key)
+            )
+        return json.loads(row[0])
+
+    def put(self, key: str, answer: Any) -> None:
+        try:
+            value = json.dumps(answer)
+        except TypeError:
+            return  # not worth caching
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?)", (key, value, time())
+            )
+            self._db.execute(
+                "DELETE FROM answers WHERE key NOT IN "
+                "(SELECT key FROM answers ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
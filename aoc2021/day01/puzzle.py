@@ -2,60 +2,60 @@
 Day 01, https://adventofcode.com/2021/day/1
 
 Notes on Solutions:
-- Part 1: Uses the new `pairwise` function in itertools introduced in Python 3.10
-- Part 2: Uses a sliding window function whose implementation has been borrowed from the 
-          wonderful [`more-itertools`](https://pypi.org/project/more-itertools/) Python package
+Both parts are solved by the `sweep` function, in a single pass over depths (from any iterable,
+e.g. streaming `depths` from a file), and for any number of window sizes at once.
+Two consecutive windows of size `n` share all but one depth: the sum increases if (and only if)
+the depth entering the window is larger than the one leaving it, `n` positions before.
+Therefore, windows are never summed, and only the last `n` depths are kept (in a ring buffer).
+- Part 1: Windows of size `1`, i.e. pairs of consecutive depths.
+- Part 2: Windows of size `3`.
 """
 
 __day__ = "01"
 __title__ = "Sonar Sweep"
 __author__ = "leriomaggio"
 
-from itertools import pairwise
 from pathlib import Path
-from collections import deque
-from itertools import islice
+from typing import Iterable, Iterator, Union
 
 
 def load(filepath: str = "./input.txt") -> list[int]:
     return list(map(int, open(filepath).read().split("\n")))
 
 
-# =========== Part 1 ============
+def depths(filepath: Union[str, Path]) -> Iterator[int]:
+    """Stream depths from file, one line at a time"""
+    with open(filepath) as lines:
+        yield from map(int, filter(str.strip, lines))
 
 
-def has_increased(left: int, right: int) -> bool:
-    return right > left
+def sweep(data: Iterable[int], windows: tuple[int, ...] = (1, 3)) -> dict[int, int]:
+    """Count how many times the sum of each window (size) of depths increases,
+    for all the windows in a single pass.
+    Only the last `max(windows)` depths are kept, in a ring buffer."""
+    size = max(windows)
+    ring, counts = [0] * size, dict.fromkeys(windows, 0)
+    for i, depth in enumerate(data):
+        for n in windows:
+            # window sums differ only by the depth entering, and the one leaving
+            if i >= n and depth > ring[(i - n) % size]:
+                counts[n] += 1
+        ring[i % size] = depth
+    return counts
 
 
-def part1(data: list[int]) -> int:
-    return len(list(filter(lambda p: has_increased(*p), pairwise(data))))
+# =========== Part 1 ============
 
 
-# =========== Part 2 ============
+def part1(data: Iterable[int]) -> int:
+    return sweep(data, windows=(1,))[1]
 
 
-def sliding_window(iterable, n):
-    # Implementation borrowed from more-itertools
-    # https://pypi.org/project/more-itertools/
-    it = iter(iterable)
-    window = deque(islice(it, n), maxlen=n)
-    if len(window) == n:
-        yield tuple(window)
-    for x in it:
-        window.append(x)
-        yield tuple(window)
-
+# =========== Part 2 ============
 
-def part2(data: list[int]) -> int:
 
-    return len(
-        list(
-            filter(
-                lambda p: has_increased(*p), pairwise(map(sum, sliding_window(data, 3)))
-            )
-        )
-    )
+def part2(data: Iterable[int]) -> int:
+    return sweep(data, windows=(3,))[3]
 
 
 if __name__ == "__main__":
@@ -63,8 +63,7 @@ if __name__ == "__main__":
     print(f"Day {__day__}: {__title__}")
     print("-" * 59)
     filepath = Path(__file__).with_name("input.txt")
-    data = load(filepath=filepath)
-    # solve part 1
-    print(part1(data))
-    # solve part 2
-    print(part2(data))
+    # solve part 1 and 2 at once, streaming depths from file
+    counts = sweep(depths(filepath), windows=(1, 3))
+    print(counts[1])
+    print(counts[3])
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, depths, sweep
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -60,3 +60,19 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 1704, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestSweep(AoCTest):
+    def test_sweep_on_sample_data(self, tmp_path):
+        LOGGER.info(f"Part 1 and 2: Test Input (Stream)")
+        filepath = tmp_path / "input.txt"
+        filepath.write_text(EXAMPLE_DATA)
+        assert sweep(depths(filepath)) == {1: 7, 3: 5}, f"Sweep - Test Input ❌"
+
+    def test_sweep_on_game_input(self, game_input):
+        LOGGER.info(f"Part 1 and 2: Game Input (Stream)")
+        counts = sweep(depths(Path(__file__).with_name("input.txt")))
+        assert counts == {1: part1(game_input), 3: part2(game_input)}
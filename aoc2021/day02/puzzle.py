@@ -2,11 +2,15 @@
 Day 02, https://adventofcode.com/2021/day/2
 
 Notes on Solutions:
-- Part 1: I've used [`getattr`](https://docs.python.org/3/library/functions.html#getattr) to dynamically
-          invoke methods from the `Submarine` class, as read from the input file. That's kinda cool.
-          I've always found Python _built-in_ reflective features quite fascinating!
-- Part 2: The whole point of `part2` is about _subclassing_. Why `dataclass`? Just becasuse they were
-         quicker to implement in this case.
+The key observation is that the `depth` in Part 1 is exactly the `aim` in Part 2, therefore
+the very same `Position` (i.e. `x`, `aim`, and `depth`) solves both parts.
+- Part 1: Commands are parsed into two arrays, i.e. _columns_, of opcodes and values (see `columns`),
+          and the whole `trajectory` of the submarine is calculated by prefix sums
+          (i.e. [`accumulate`](https://docs.python.org/3/library/itertools.html#itertools.accumulate)):
+          `x` is the sum of `forward` values, whereas `aim` is the sum of `down` minus `up` values.
+- Part 2: The `depth` is again a prefix sum, of the `forward` values each multiplied by the current `aim`.
+          Commands can also be replayed one at a time (see `replay`), e.g. streaming lines
+          from a file, without loading it all.
 """
 
 __day__ = "02"
@@ -14,62 +18,66 @@ __title__ = "Dive"
 __author__ = "leriomaggio"
 
 from pathlib import Path
-from typing import Union
-from dataclasses import dataclass
+from typing import Iterable, Iterator, Union
+from array import array
+from collections import namedtuple
+from itertools import accumulate
+
+FORWARD, DOWN, UP = range(3)
+OPCODES = {"forward": FORWARD, "down": DOWN, "up": UP}
+AIM = (0, 1, -1)  # i.e. sign of the change of aim, per opcode
+
+Position = namedtuple("Position", ["x", "aim", "depth"])
 
 
 def load(lines: list[str]) -> list[tuple[str, str]]:
     return list(map(lambda l: tuple(l.split()), lines))
 
 
-# =========== Part 1 ============
+def columns(data: Iterable[tuple[str, str]]) -> tuple[array, array]:
+    """Commands as two arrays: opcodes, and values"""
+    opcodes, values = array("b"), array("q")
+    for cmd, value in data:
+        opcodes.append(OPCODES[cmd])
+        values.append(int(value))
+    return opcodes, values
 
 
-@dataclass
-class Submarine:
-    x: int = 0
-    y: int = 0
+def trajectory(opcodes: array, values: array) -> list[Position]:
+    """Position after each command, as prefix sums of the commands"""
+    forward = [v if op == FORWARD else 0 for op, v in zip(opcodes, values)]
+    aims = list(accumulate(AIM[op] * v for op, v in zip(opcodes, values)))
+    depths = accumulate(a * f for a, f in zip(aims, forward))
+    return list(map(Position, accumulate(forward), aims, depths))
 
-    def forward(self, x: int):
-        self.x += x
 
-    def up(self, y: int):
-        self.y -= y
+def replay(lines: Iterable[str]) -> Iterator[Position]:
+    """Position after each command, streaming commands (e.g. from a file)"""
+    x = aim = depth = 0
+    for line in lines:
+        cmd, value = line.split()
+        op, value = OPCODES[cmd], int(value)
+        if op == FORWARD:
+            x, depth = x + value, depth + aim * value
+        else:
+            aim += AIM[op] * value
+        yield Position(x, aim, depth)
 
-    def down(self, y: int):
-        self.y += y
+
+# =========== Part 1 ============
 
 
 def part1(data: list[tuple[str, str]]) -> int:
-    submarine = Submarine()
-    for cmd, value in data:
-        getattr(submarine, cmd)(int(value))
-    return submarine.x * submarine.y
+    final = trajectory(*columns(data))[-1]
+    return final.x * final.aim  # i.e. the depth, in part 1
 
 
 # =========== Part 2 ============
 
 
-@dataclass
-class Torpedo(Submarine):
-    aim: int = 0
-
-    def forward(self, x: int):
-        self.x += x
-        self.y += self.aim * x
-
-    def up(self, a: int):
-        self.aim -= a
-
-    def down(self, a: int):
-        self.aim += a
-
-
 def part2(data: list[tuple[str, str]]) -> int:
-    torpedo = Torpedo()
-    for cmd, value in data:
-        getattr(torpedo, cmd)(int(value))
-    return torpedo.x * torpedo.y
+    final = trajectory(*columns(data))[-1]
+    return final.x * final.depth
 
 
 if __name__ == "__main__":
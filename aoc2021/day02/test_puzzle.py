@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, replay
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -54,6 +54,11 @@ class TestPartTwo(AoCTest):
         LOGGER.info(f"Part 2: Test Input")
         assert part2(sample_input) == 900, f"Part 2 - Test Input ❌"
 
+    def test_replay_on_sample_data(self):
+        LOGGER.info(f"Part 2: Test Input (Replay)")
+        *_, final = replay(EXAMPLE_DATA.splitlines())
+        assert final.x * final.depth == 900, f"Part 2 - Test Input (Replay) ❌"
+
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 1592426537, f"Part 2 - Game Input ❌"
@@ -2,13 +2,17 @@
 Day 03, https://adventofcode.com/2021/day/3
 
 Notes on Solutions:
+Readings are parsed into integers (see `parse`), so bits are never handled as characters.
 - Part 1: This part is all about calculating the `gamma_rate`, since the `epsilon_rate` is easily
-          determined as the _complement_ of the former. In fact, the `complement` (`lambda`) function
-          has been defined, using `mod 2` arithmentic. Also, `most_common_bits` function's implementation
-          uses the new _Walrus Operator_ in Python to define and use `ones` in one-liner.
-- Part 2: Not very much to say here apart maybe mentioning the use of the `f_bits` paramenter in the
-          `rate` function which allows to re-use the same implementation for both `oxygen` and `co2` rates.
-          (Default is the identity function)
+          determined as the _complement_ of the former (i.e. `xor` with all ones).
+          The number of ones on each bit is counted over all the readings at once, as the sum of
+          the readings masked on that bit (see `ones_per_bit`).
+- Part 2: Readings are sorted once, so that readings sharing the same leading bits are always contiguous,
+          i.e. sorted readings are the leaves of a binary _trie_. Therefore, rather than filtering
+          lists, the `rate` function walks down the trie: at each bit, the current range is split
+          into readings with `0` and `1` with a binary search, and one of the two is kept.
+          The `least_common` paramenter allows to re-use the same implementation
+          for both `oxygen` and `co2` rates.
 """
 
 __day__ = "03"
@@ -17,49 +21,64 @@ __author__ = "leriomaggio"
 
 
 from pathlib import Path
-from typing import Union, Callable
-from operator import add
-from functools import reduce
+from typing import Union
+from bisect import bisect_left
 
 
 def load(filepath: Union[str, Path]) -> list[str]:
     return open(filepath).read().strip().splitlines()
 
 
-# =========== Part 1 ============
+def parse(data: list[str]) -> tuple[list[int], int]:
+    """Readings as integers, along with their number of bits"""
+    return [int(reading, base=2) for reading in data], len(data[0])
 
 
-def most_common_bit(bits: str) -> str:
-    zeros = len(bits) - (ones := len(list(filter(lambda b: b == "1", bits))))
-    return "1" if ones >= zeros else "0"
+# =========== Part 1 ============
 
 
-complement = lambda b: str((int(b) + 1) % 2)
+def ones_per_bit(readings: list[int], nbits: int) -> list[int]:
+    """Number of readings with each bit set (i.e. column-wise popcount), from the LSB"""
+    return [sum(map((1 << bit).__and__, readings)) >> bit for bit in range(nbits)]
 
 
 def part1(data: list[str]) -> int:
-    gamma_rate = reduce(add, map(most_common_bit, zip(*data)))
-    epsilon_rate = reduce(add, map(complement, gamma_rate))
-    return int(gamma_rate, base=2) * int(epsilon_rate, base=2)
+    readings, nbits = parse(data)
+    gamma_rate = sum(
+        1 << bit
+        for bit, ones in enumerate(ones_per_bit(readings, nbits))
+        if ones >= len(readings) - ones
+    )
+    epsilon_rate = gamma_rate ^ ((1 << nbits) - 1)  # i.e. the complement
+    return gamma_rate * epsilon_rate
 
 
 # =========== Part 2 ============
 
 
-def rate(diagnostics: list[str], f_bits: Callable[[str], str] = lambda b: b) -> str:
-    nr_of_bits = len(diagnostics[0])
-    for idx in range(nr_of_bits):
-        mcb = f_bits(most_common_bit([b[idx] for b in diagnostics]))
-        diagnostics = list(filter(lambda b: b[idx] == mcb, diagnostics))
-        if len(diagnostics) == 1:
+def rate(readings: list[int], nbits: int, least_common: bool = False) -> int:
+    """Walk down the (implicit) binary trie of the sorted readings: readings still
+    selected always share the bits considered so far, and so they are a contiguous
+    range `[lo, hi)` which is split (binary search) into zeros and ones on the next bit."""
+    lo, hi, prefix = 0, len(readings), 0
+    for bit in reversed(range(nbits)):
+        if hi - lo == 1:
             break
-    return diagnostics[0]
+        mid = bisect_left(readings, prefix | (1 << bit), lo, hi)
+        zeros, ones = mid - lo, hi - mid
+        if (ones >= zeros) != least_common:
+            lo, prefix = mid, prefix | (1 << bit)
+        else:
+            hi = mid
+    return readings[lo]
 
 
 def part2(data: list[str]) -> int:
-    oxygen_rate = rate(data)
-    co2_rate = rate(data, f_bits=complement)
-    return int(oxygen_rate, base=2) * int(co2_rate, base=2)
+    readings, nbits = parse(data)
+    readings.sort()
+    oxygen_rate = rate(readings, nbits)
+    co2_rate = rate(readings, nbits, least_common=True)
+    return oxygen_rate * co2_rate
 
 
 if __name__ == "__main__":
@@ -5,15 +5,15 @@ Notes on Solutions:
 - Part 1: The core implementation of the solution here lies in the `Board` class, which represents a board of number
           as a dictionary of pairs (i.e. coordinates). This is a generally convenient representation for a Matrix in
           pure Python (that is, not using the magics of [NumPy](http://numpy.org)).
-          This is particularly convenient whenever solutions using `filter` and `lambda` are used, so that we don't
-          require to parse coordinates for rows and cols.
+          The game is played by the `Bingo` class, which never scans boards looking for a number: it builds a
+          reverse index from each number to the `(board, row, col)` holding it. Each draw updates only those boards,
+          counting the hits per row and per column (a **bingo** is when a counter reaches the size of the board),
+          and the sum of the unmarked numbers, i.e. the score, all in constant time.
 - Part 2: This part was pretty straightforward to implement, as the only thing we had to change was the play rule/criterion.
           In particular, we have to keep on playing until the last `Board` marks its **bingo** (this will ultimately always
           happen as all the numbers are drawn from the pool!). This has been implemented using class _inheritance_.
-          The only thing worthwhile mentioning here though is that new playing rules are implemented using an
-          `OrderedDict` to keep track of the winning boards. This won't be _really_ necessary in Python 3.7+ since
-          dictionaries now keep track of the insertion order by default (and we're using **Python 3.10!**),
-          but I guess it is always a good practice making implementations as general as possible!
+          Boards getting their bingo are generated (in turn) by `Bingo.draws`, which is shared by both the rules:
+          `ResilientBingo` just keeps on drawing until the very last one.
 """
 
 __day__ = "04"
@@ -22,8 +22,9 @@ __author__ = "leriomaggio"
 
 
 from pathlib import Path
+from typing import Iterator
 from dataclasses import dataclass
-from collections import OrderedDict
+from collections import defaultdict
 
 
 def load(lines: list[str]):
@@ -54,52 +55,12 @@ class Board:
         self.board = {
             (i, j): v for i, row in enumerate(numbers) for j, v in enumerate(row)
         }
-        self.board_state = {k: 0 for k in self.board}
         self.nrows, self.ncols = self.shape(self.board)
 
     @staticmethod
     def shape(board: dict[tuple[int], int]) -> tuple[int]:
         return (max(l + 1 for l, _ in board), max(r + 1 for _, r in board))
 
-    def mark(self, number: int):
-        for coord in filter(lambda c: self.board[c] == number, self.board):
-            self.board_state[coord] = 1
-
-    def bingo(self):
-        return any(
-            map(
-                lambda row: all(
-                    map(
-                        lambda c: self.board_state[c] == 1,
-                        filter(lambda coord: coord[0] == row, self.board_state),
-                    )
-                ),
-                range(self.nrows),
-            )
-        ) or any(
-            map(
-                lambda col: all(
-                    map(
-                        lambda c: self.board_state[c] == 1,
-                        filter(lambda coord: coord[1] == col, self.board_state),
-                    )
-                ),
-                range(self.ncols),
-            )
-        )
-
-    def score(self, winning_number: int) -> int:
-
-        return (
-            sum(
-                map(
-                    self.board.get,
-                    filter(lambda c: self.board_state[c] == 0, self.board_state),
-                )
-            )
-            * winning_number
-        )
-
     def __repr__(self):
         return str(self)
 
@@ -112,12 +73,42 @@ class Bingo:
     numbers: list[int]
     boards: list[Board]
 
-    def play(self) -> int:
+    def __post_init__(self):
+        # reverse index: number -> (board, row, col), in board order
+        self.index = defaultdict(list)
+        for b, board in enumerate(self.boards):
+            for (row, col), number in board.board.items():
+                self.index[number].append((b, row, col))
+
+    def draws(self) -> Iterator[tuple[int, int]]:
+        """Play all the numbers, generating (board, number) of each board
+        getting its bingo, in turn. Only boards holding the number are updated,
+        counting hits per row and column."""
+        row_hits = [[0] * board.nrows for board in self.boards]
+        col_hits = [[0] * board.ncols for board in self.boards]
+        self.unmarked = [sum(board.board.values()) for board in self.boards]
+        won, drawn = [False] * len(self.boards), set()
         for number in self.numbers:
-            for board in self.boards:
-                board.mark(number)
-                if board.bingo():
-                    return board.score(number)
+            if number in drawn:
+                continue
+            drawn.add(number)
+            for b, row, col in self.index.get(number, ()):
+                if won[b]:
+                    continue
+                self.unmarked[b] -= number
+                row_hits[b][row] += 1
+                col_hits[b][col] += 1
+                board = self.boards[b]
+                if row_hits[b][row] == board.ncols or col_hits[b][col] == board.nrows:
+                    won[b] = True
+                    yield b, number
+
+    def score(self, b: int, winning_number: int) -> int:
+        return self.unmarked[b] * winning_number
+
+    def play(self) -> int:
+        for b, number in self.draws():
+            return self.score(b, number)
         return 0
 
 
@@ -131,19 +122,10 @@ def part1(numbers: list[int], boards: list[Board]) -> int:
 
 class ResilientBingo(Bingo):
     def play(self) -> int:
-        boards_winning = OrderedDict()
-        for number in self.numbers:
-            for board in filter(
-                lambda b: b.board_id not in boards_winning,
-                self.boards,
-            ):
-                board.mark(number)
-                if board.bingo():
-                    boards_winning[board.board_id] = (board, number)
-        board, number = list(
-            boards_winning.values()
-        ).pop()  # we're sure thanks to OrderedDict
-        return board.score(number)
+        last_winning = None
+        for last_winning in self.draws():
+            pass  # i.e. the boards that already won are not updated anymore
+        return self.score(*last_winning) if last_winning else 0
 
 
 def part2(numbers: list[int], boards: list[Board]) -> int:
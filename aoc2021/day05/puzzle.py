@@ -10,19 +10,24 @@ Notes on Solutions:
           Then `Points` are sorted (using Python tuple sorting)
           so that `source` and `destination` will always correspond to `left`
           and `right` of each `Vent`.
-          All that said, I guess the new entry for this challenge is the
-          [`chain`](https://docs.python.org/3/library/itertools.html#itertools.chain) and [`chain.from_iterable`](https://docs.python.org/3/library/itertools.html#itertools.chain.from_iterable) 
-          functions which are used in turn to easily iterate over the whole
-          matrix, and lazy iterable generated for coordinates.
-          The `line_segment` function uses `product` to simply generate the
-          right set of coordinates, without checking which is the repeated
-          index.
-- Part 2: In part2 90% of the implementation is borrowed//re-used from _part 1_
-          apart from the `diagonal_segment` function which this times generates
-          coordinates for **only** elements on the main diagonal.
-          Therefore, this time is even easier as we don't need to generate the 
-          all cartesian product of coordinates (to get a sub-matrix, btw)
-          but just `zip` would suffice.
+          Each `Segment` is an interval of positions on its line, identified by a direction
+          (one of `LINES`) and a `key` (e.g. the row, for horizontal lines).
+          Points where vents overlap are then of two kinds:
+          1) overlaps among segments on the very same line, i.e. intervals found with a sweep
+             over the (sorted) endpoints (see `overlaps`);
+          2) crossings of lines of different directions (see `merge`, for the points covered by
+             each line).
+          Crossing points are never enumerated one by one (there can be up to quadratically many
+          in the number of vents): the map is scanned row by row (see `count_overlaps`), and the
+          points of each row covered by the lines of each direction are bit-packed in a single
+          integer. These are updated only when lines start or end (see `scanlines`), apart from
+          diagonal lines, which are simply shifted by one column at each row.
+          Points covered twice in a row are then just a few bitwise operations, and a `bit_count`.
+          Time is therefore O(n log n) in the number of vents n, plus (rows + n) x columns / 64
+          word operations (i.e. on bit-packed rows), and memory is O(n) plus a few rows of bits:
+          neither depends on the number of crossings.
+- Part 2: In part2 the implementation is the same of _part 1_, just including also the 
+          diagonal vents (in both directions) this time, rather than only horizontal and vertical ones.
 """
 
 __day__ = "05"
@@ -31,11 +36,17 @@ __author__ = "leriomaggio"
 
 
 from pathlib import Path
-from collections import namedtuple
-from itertools import chain, product
-from typing import Iterable
+from collections import namedtuple, defaultdict
+from itertools import chain
+from typing import Callable, Iterable
 
 Point = namedtuple("Point", ["x", "y"])
+Segment = namedtuple("Segment", ["line", "key", "start", "end"])
+
+# Directions of the lines of vents, as the coefficients (a, b) of their equation
+# a * x + b * y = key (i.e. horizontal, vertical, diagonal, and anti-diagonal)
+LINES = ((1, 0), (0, 1), (1, -1), (1, 1))
+HORIZONTAL, VERTICAL, DIAGONAL, ANTI_DIAGONAL = range(len(LINES))
 
 
 def load(lines: list[str]) -> list[tuple[Point, Point]]:
@@ -60,54 +71,123 @@ def load(lines: list[str]) -> list[tuple[Point, Point]]:
 is_line = lambda pots: (pots[0].x == pots[1].x) or (pots[0].y == pots[1].y)
 
 
-def line_segment(left: Point, right: Point) -> Iterable[Point]:
-    rows, cols = range(left.x, right.x + 1), range(left.y, right.y + 1)
-    return product(rows, cols)
+def segment(left: Point, right: Point) -> Segment:
+    """Segment from left to right (sorted), as an interval of positions on its line.
+    Positions are `y` for horizontal lines, and `x` for all the others."""
+    if left.x == right.x:
+        return Segment(HORIZONTAL, left.x, left.y, right.y)
+    if left.y == right.y:
+        return Segment(VERTICAL, left.y, left.x, right.x)
+    if right.y - left.y == right.x - left.x:
+        return Segment(DIAGONAL, left.x - left.y, left.x, right.x)
+    return Segment(ANTI_DIAGONAL, left.x + left.y, left.x, right.x)
 
 
-def shape(vents: list[tuple[Point, Point]]) -> tuple[int, int]:
-    all_points = list(
-        chain.from_iterable((map(lambda p: p[0], vents), map(lambda p: p[1], vents)))
-    )
-    return (
-        max(all_points, key=lambda p: p.x).x + 1,
-        max(all_points, key=lambda p: p.y).y + 1,
+def overlaps(segments: list[Segment]) -> list[tuple[int, int]]:
+    """Intervals (sorted, and disjoint) of the positions covered by at least two
+    of the segments, all on the very same line"""
+    events = sorted(
+        chain.from_iterable(((s.start, 1), (s.end + 1, -1)) for s in segments)
     )
+    intervals, covering, start = list(), 0, None
+    for pos, delta in events:
+        covering += delta
+        if covering >= 2 and start is None:
+            start = pos
+        elif covering < 2 and start is not None:
+            if pos > start:
+                intervals.append((start, pos - 1))
+            start = None
+    return intervals
+
+
+def merge(segments: list[Segment]) -> list[tuple[int, int]]:
+    """Intervals (sorted, and disjoint) of the positions covered by the segments,
+    all on the very same line"""
+    intervals = list()
+    for s in sorted(segments, key=lambda s: s.start):
+        if intervals and s.start <= intervals[-1][1] + 1:
+            intervals[-1] = intervals[-1][0], max(intervals[-1][1], s.end)
+        else:
+            intervals.append((s.start, s.end))
+    return intervals
+
+
+def rows(s: Segment) -> tuple[int, int]:
+    """First and last row covered by the segment"""
+    return (s.key, s.key) if s.line == HORIZONTAL else (s.start, s.end)
+
+
+def scanlines(
+    lines: dict[tuple[int, int], list[Segment]],
+    layer: Callable[[list[Segment]], list[tuple[int, int]]],
+    top: int,
+) -> dict[tuple[int, int], list[tuple[int, int]]]:
+    """Intervals (given by layer, e.g. `merge`) of all the lines, as changes of the
+    bit-packed rows: horizontal intervals are the range of their columns, in their row;
+    any other line is a single bit (i.e. its key), set in the first row of the interval,
+    and reset right after the last one. Diagonal keys are counted down from top
+    (i.e. the last row), so that all their bits are non-negative."""
+    changes = defaultdict(list)
+    for (line, key), on_line in lines.items():
+        for start, end in layer(on_line):
+            if line == HORIZONTAL:
+                changes[line, key].append((start, end))
+                continue
+            bit = top - key if line == DIAGONAL else key
+            changes[line, start].append((bit, bit))
+            changes[line, end + 1].append((bit, bit))
+    return changes
+
+
+def mask(intervals: list[tuple[int, int]]) -> int:
+    """Bits of the (inclusive) intervals, packed into a single integer"""
+    bits = 0
+    for start, end in intervals:
+        bits ^= ((1 << (end - start + 1)) - 1) << start
+    return bits
+
+
+def count_overlaps(vents: Iterable[tuple[Point, Point]]) -> int:
+    """Number of points where at least two vents overlap, scanning the map row by row.
+    In each row, vents of each direction are bit-packed in a single integer (one bit
+    per column): points covered by (at least) two vents are either covered by two
+    directions, or by two vents on the very same line."""
+    lines = defaultdict(list)
+    for points in vents:
+        s = segment(*points)
+        lines[s.line, s.key].append(s)
+    if not lines:
+        return 0
+    spans = [rows(s) for on_line in lines.values() for s in on_line]
+    first, top = min(f for f, _ in spans), max(l for _, l in spans)
+    # points covered by at least one vent, and by at least two on the same line
+    layers = [scanlines(lines, merge, top), scanlines(lines, overlaps, top)]
+    active = [[0] * len(LINES) for _ in layers]
+    total = 0
+    for r in range(first, top + 1):
+        covered = list()
+        for changes, on in zip(layers, active):
+            for line in (VERTICAL, DIAGONAL, ANTI_DIAGONAL):
+                on[line] ^= mask(changes.get((line, r), []))
+            # i.e. diagonal lines move by one column, at each row
+            d, a = on[DIAGONAL] >> (top - r), on[ANTI_DIAGONAL] >> r
+            covered.append((mask(changes.get((HORIZONTAL, r), [])), on[VERTICAL], d, a))
+        (h, v, d, a), twice = covered
+        crossings = (h & (v | d | a)) | (v & (d | a)) | (d & a)
+        total += (crossings | twice[0] | twice[1] | twice[2] | twice[3]).bit_count()
+    return total
 
 
 def part1(vents: list[tuple[Point, Point]]) -> int:
-    nrows, ncols = shape(vents)
-    board = [[0 for _ in range(ncols)] for _ in range(nrows)]
-    coordinates = chain.from_iterable(
-        map(lambda points: line_segment(*points), filter(is_line, vents))
-    )
-    for row, col in coordinates:
-        board[row][col] += 1
-    return len(list(filter(lambda v: v >= 2, chain(board))))
+    return count_overlaps(filter(is_line, vents))
 
 
 # =========== Part 2 ============
 
 
-def diagonal_segment(left: Point, right: Point) -> Iterable[Point]:
-    if is_line((left, right)):
-        return line_segment(left, right)
-    stepy = 1 if left.y <= right.y else -1
-    stepx = 1 if left.x <= right.x else -1
-    return zip(
-        range(left.x, right.x + stepx, stepx), range(left.y, right.y + stepy, stepy)
-    )
-
-
 def part2(vents: list[tuple[Point, Point]]) -> int:
-    nrows, ncols = shape(vents)
-    board = [[0 for _ in range(ncols)] for _ in range(nrows)]
-    coordinates = chain.from_iterable(
-        map(lambda points: diagonal_segment(*points), vents)
-    )
-    for row, col in coordinates:
-        board[row][col] += 1
-    return len(list(filter(lambda v: v >= 2, chain(board))))
+    return count_overlaps(vents)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, count_overlaps
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -61,3 +61,19 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 17717, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestCrossings(AoCTest):
+    def test_lattice(self):
+        LOGGER.info(f"Part 1 and 2: Lattice (Quadratic Crossings)")
+        # n horizontal and n vertical vents, each crossing all the others
+        n = 500
+        lines = [f"0,{i} -> {n - 1},{i}" for i in range(n)]
+        lines += [f"{i},0 -> {i},{n - 1}" for i in range(n)]
+        assert count_overlaps(load(lines)) == n * n, f"Lattice ❌"
+        # plus as many diagonal vents, all through the points of the lattice
+        lines += [f"0,{i} -> {n - 1 - i},{n - 1}" for i in range(n)]
+        assert count_overlaps(load(lines)) == n * n, f"Lattice - Diagonals ❌"
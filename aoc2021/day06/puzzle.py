@@ -2,23 +2,26 @@
 Day 06, https://adventofcode.com/2021/day/6
 
 Notes on Solutions:
-- Part 1: This solution solves the puzzle using _brute-force_, that is enumerating 
-          all the generations of lanternfish up until generation `80`.
-          The only sensible thing to mention here is how using `dataclass` is 
-          appropriate in this case (only in terms of data abstractions), saving
-          lots of boilerplate code.
-- Part 2: This solution is **way** more interesting, and scales pretty easily to any number
-          of days. First, we do not enumerate with brute force all the breeds (like in Part 1)
-          as it is NOT computationally feasible. The growth rate is indeed exponential, so 
-          it explodes quite soon. What we do instead, is to generate the counts of breeds
-          in each day, given an initial state. Crucial for this solution is the 
-          [`defaultdict`](https://docs.python.org/3/library/collections.html#collections.defaultdict)
-          data structure, which is very flexible and handy to keep summing up counts, without needing
-          to check the presence of keys.
+- Part 1: We do not enumerate all the generations of lanternfish up until generation `80`
+          (growth is exponential, and so is memory), but we generate the counts of fish per
+          clock value (i.e. `0-8`), given an initial state: the `School`.
+          Counts are kept in a list of 9 _rotating_ slots (see `School.simulate`), so that
+          a day is just one sum, with no data structure to rebuild.
+- Part 2: This solution scales pretty easily to any number of days. Moving counts from one day
+          to the next is a linear transformation, i.e. the (9x9) `TRANSITION` matrix, and so
+          the counts after `n` days are `TRANSITION ** n` times the initial ones.
+          The power is calculated by _repeated squaring_ (see `School.after`) in `O(log n)`
+          matrix products. Powers of two are cached in the `School`, so answering for
+          many days at once (`School.after_all`) is almost free. Counts grow exponentially
+          (i.e. linear number of digits), therefore very large days (e.g. `10**12`) also
+          require a `modulus`.
           Just for fun, with a more functional take there is an alternative solution proposed using 
           a generator for the breeds, in combination with 
           [`itertools.groupby`](https://docs.python.org/3/library/itertools.html#itertools.groupby)
           which allows to group and sum counts accordingly, directly withing the **dictionary comprehension**.
+          The [`defaultdict`](https://docs.python.org/3/library/collections.html#collections.defaultdict)
+          data structure is very flexible and handy to keep summing up counts, without needing
+          to check the presence of keys.
 """
 
 __day__ = "06"
@@ -26,51 +29,89 @@ __title__ = "Lanternfish"
 __author__ = "leriomaggio"
 
 from pathlib import Path
-from dataclasses import dataclass
+from typing import Iterable, Optional
 from collections import defaultdict
 from timeit import repeat
 
+Matrix = list[list[int]]
+
+# Transition of the counts of lanternfish per clock (0-8) in one day:
+# T[i][j] is the number of fish with clock i tomorrow, per each fish with clock j today.
+TRANSITION = [[int(j == i + 1) for j in range(9)] for i in range(9)]
+TRANSITION[6][0] = TRANSITION[8][0] = 1
+
+
+def matmul(A: Matrix, B: Matrix, modulus: Optional[int] = None) -> Matrix:
+    product = [[sum(a * b for a, b in zip(row, col)) for col in zip(*B)] for row in A]
+    if modulus:
+        product = [[v % modulus for v in row] for row in product]
+    return product
+
+
+class School:
+    """Counts of lanternfish, per clock value, optionally modulo `modulus`"""
+
+    def __init__(self, clocks: Iterable[int], modulus: Optional[int] = None):
+        self.counts = [0] * 9
+        for clock in clocks:
+            self.counts[clock] += 1
+        self.modulus = modulus
+        self._powers = [TRANSITION]  # i.e. TRANSITION ** (2 ** k)
+
+    @classmethod
+    def from_line(cls, line: str, modulus: Optional[int] = None) -> "School":
+        return cls(map(int, line.strip().split(",")), modulus)
+
+    def _power(self, k: int) -> Matrix:
+        while len(self._powers) <= k:
+            M = self._powers[-1]
+            self._powers.append(matmul(M, M, self.modulus))
+        return self._powers[k]
+
+    def simulate(self, days: int) -> int:
+        """Size of the school after days, one day at a time.
+        Counts are rotating: clock `k` on day `d` is at slot `(d + k) % 9`. Fish at clock 0
+        restart from clock 8 (i.e. the very same slot), and their breeds join clock 6."""
+        counts = self.counts[:]
+        for d in range(days):
+            counts[(d + 7) % 9] += counts[d % 9]
+            if self.modulus:
+                counts[(d + 7) % 9] %= self.modulus
+        return self._total(counts)
+
+    def after(self, days: int) -> int:
+        """Size of the school after days, in O(log days) (9x9) matrix products"""
+        counts, k = self.counts[:], 0
+        while days:
+            if days & 1:
+                counts = [
+                    row[0] for row in matmul(self._power(k), [[c] for c in counts])
+                ]
+                if self.modulus:
+                    counts = [c % self.modulus for c in counts]
+            days, k = days >> 1, k + 1
+        return self._total(counts)
+
+    def after_all(self, days: Iterable[int]) -> list[int]:
+        """Size of the school after each of the days (sharing the powers of TRANSITION)"""
+        return [self.after(d) for d in days]
+
+    def _total(self, counts: list[int]) -> int:
+        return sum(counts) % self.modulus if self.modulus else sum(counts)
 
-# =========== Part 1 ============
-@dataclass
-class LanternFish:
-    clock: int = 8
 
-    def spawn(self):
-        if self.clock > 0:
-            self.clock -= 1
-            return None
-        self.clock = 6
-        return LanternFish()
+# =========== Part 1 ============
 
 
 def part1(line: str) -> int:
-    fish = [LanternFish(clock=c) for c in map(int, line.strip().split(","))]
-    for _ in range(80):
-        new_gen = []
-        for lf in fish:
-            breed = lf.spawn()
-            if breed:
-                new_gen.append(breed)
-        fish += new_gen
-    return len(fish)
+    return School.from_line(line).simulate(days=80)
 
 
 # =========== Part 2 ============
 
 
 def part2(line: str, days: int = 256) -> int:
-    lanternfish = defaultdict(int)
-    for clock in map(int, line.split(",")):
-        lanternfish[clock] += 1
-
-    for _ in range(days):
-        lanternfish = defaultdict(int, {k - 1: v for k, v in lanternfish.items()})
-        if breed := lanternfish.pop(-1, 0):
-            lanternfish[6] += breed
-            lanternfish[8] += breed
-        fish = lanternfish
-    return sum(fish.values())
+    return School.from_line(line).after(days)
 
 
 # ------------- (ALTERNATIVE Solution) ----------------------
@@ -151,10 +192,11 @@ if __name__ == "__main__":
 
     import timeit
 
-    # just once as it's pretty slow!
     print(
-        "TIME Part [1] (just once): ",
-        timeit.timeit("timeit_p1()", setup="from __main__ import timeit_p1", number=1),
+        "TIME Part [1] (1000 times)",
+        timeit.timeit(
+            "timeit_p1()", setup="from __main__ import timeit_p1", number=1000
+        ),
     )
     print(
         "TIME Part [2] (1000 times)",
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import part1, part2
+from puzzle import part1, part2, School
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -47,6 +47,14 @@ class TestPartTwo(AoCTest):
         LOGGER.info(f"Part 2: Test Input")
         assert part2(sample_input) == 26984457539, f"Part 2 - Test Input ❌"
 
+    def test_part2_many_days_on_sample_data(self, sample_input):
+        LOGGER.info(f"Part 2: Test Input (Many Days)")
+        school = School.from_line(sample_input)
+        expected = [26, 5934, 26984457539]
+        assert school.after_all([18, 80, 256]) == expected, f"Part 2 - Many Days ❌"
+        school = School.from_line(sample_input, modulus=1000)
+        assert school.after(256) == 539, f"Part 2 - Modulus ❌"
+
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 1613415325809, f"Part 2 - Game Input ❌"
@@ -2,20 +2,20 @@
 Day 07, https://adventofcode.com/2021/day/07
 
 Notes on Solutions:
-- Part 1: The solution to this challenge is pretty straightforward, and there isn't
-          really much to say about it. In Part 1 we enumerate all the 
-          fuel consumptions, that is the sum of all the corresponding 
-          (absolute) distances, for all the **unique** available positions, 
-          and we take the minimum.
-- Part 2: This solution reuses exactly the same code (in a functional fashion)
-          of the previous solution. However, this time all possible positions
-          on the board should be considered. Therefore, the outer iterable
-          is set to `range(max(positions) + 1)`. 
-          The fuel consumptions rule can be calculated immediately as it does
-          correspond to the sum of the first `N` naturals (absolute differences, 
-          in this case!). To do so, the `walrus` operator is first used to 
-          store the value of the distance, which is then used within the same 
-          calculation for the final result!.
+Both parts are solved by the `Crabs` class, which sorts positions once, and calculates
+their prefix sums. This way, the fuel for any target is calculated without considering
+each crab: those on the left of the target (found by binary search) are `k`, and their
+distances sum up to `target * k - prefix[k]`; similarly for those on the right.
+
+- Part 1: The sum of the (absolute) distances is minimum on the **median** of the positions,
+          so there is no need to try all the targets.
+- Part 2: The fuel consumptions rule corresponds to the sum of the first `d` naturals,
+          i.e. `(d**2 + d) / 2` for a distance `d`. The sum of the squares of distances
+          is also calculated in constant time (expanding `(p - target) ** 2`), given the
+          sum of the squares of positions.
+          This cost is convex, and its minimum is within `1/2` from the **mean** of the positions
+          (the squares pull towards the mean, the distances towards the median, but with half weight),
+          therefore only the integer targets around the mean are considered.
 """
 
 __day__ = "07"
@@ -24,38 +24,68 @@ __author__ = "leriomaggio"
 
 from typing import Union
 from pathlib import Path
+from bisect import bisect_left
+from itertools import accumulate
 
 
 def load(filepath: Union[str, Path]):
     return list(map(int, open(filepath).read().strip().split(",")))
 
 
+class Crabs:
+    """Crab positions, sorted once, along with their prefix sums, so that
+    the fuel to align all the crabs on any target is calculated in `O(log n)`"""
+
+    def __init__(self, positions: list[int]) -> None:
+        self.positions = sorted(positions)
+        self.prefix = list(accumulate(self.positions, initial=0))
+        self.squares = sum(p * p for p in self.positions)
+
+    def distance(self, target: int) -> int:
+        """Sum of the (absolute) distances of all the crabs from target"""
+        n, total = len(self.positions), self.prefix[-1]
+        k = bisect_left(self.positions, target)  # i.e. crabs on the left of target
+        left, right = target * k - self.prefix[k], total - self.prefix[k]
+        return left + right - target * (n - k)
+
+    def fuel(self, target: int, triangular: bool = False) -> int:
+        """Fuel to align all the crabs on target. With triangular cost,
+        fuel for distance d is 1 + 2 + ... + d = (d**2 + d) / 2"""
+        if not triangular:
+            return self.distance(target)
+        n, total = len(self.positions), self.prefix[-1]
+        squares = self.squares - 2 * target * total + n * target * target
+        return (squares + self.distance(target)) // 2
+
+    def align(self, triangular: bool = False) -> tuple[int, int]:
+        """Best target, and the fuel to align all the crabs on it"""
+        n = len(self.positions)
+        if not triangular:
+            median = self.positions[(n - 1) // 2]
+            return median, self.fuel(median)
+        # the best target is within 1/2 from the mean
+        mean = self.prefix[-1] // n
+        lo, hi = self.positions[0], self.positions[-1]
+        candidates = range(max(lo, mean - 1), min(hi, mean + 2) + 1)
+        return min(
+            ((t, self.fuel(t, triangular)) for t in candidates), key=lambda e: e[1]
+        )
+
+
 # =========== Part 1 ============
 
 
 def part1(positions: list[int]) -> int:
-    return min(
-        map(
-            lambda target: sum(map(lambda p: abs(target - p), positions)),
-            set(positions),
-        )
-    )
+    _, fuel = Crabs(positions).align()
+    return fuel
 
 
 # =========== Part 2 ============
 
-from itertools import product
-
 
 def part2(positions: list[int]) -> int:
-    return min(
-        map(
-            lambda target: sum(
-                map(lambda p: ((d := abs(target - p)) * (d + 1)) // 2, positions)
-            ),
-            range(max(positions) + 1),
-        )
-    )
+    _, fuel = Crabs(positions).align(triangular=True)
+    return fuel
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, Crabs
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -50,3 +50,22 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 95581659, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestCrabs(AoCTest):
+    def test_fuel_on_sample_data(self, sample_input):
+        LOGGER.info(f"Part 1 and 2: Test Input (Fuel)")
+        crabs = Crabs(sample_input)
+        assert crabs.fuel(2) == 37, f"Fuel - Linear ❌"
+        assert crabs.fuel(5, triangular=True) == 168, f"Fuel - Triangular ❌"
+        assert crabs.fuel(2, triangular=True) == 206, f"Fuel - Triangular ❌"
+        assert crabs.fuel(1, triangular=True) == 242, f"Fuel - Triangular ❌"
+
+    def test_align_on_sample_data(self, sample_input):
+        LOGGER.info(f"Part 1 and 2: Test Input (Align)")
+        crabs = Crabs(sample_input)
+        assert crabs.align() == (2, 37), f"Align - Linear ❌"
+        assert crabs.align(triangular=True) == (5, 168), f"Align - Triangular ❌"
@@ -9,9 +9,13 @@ Notes on Solutions:
           then trying to workout general decoding rules using the patterns for those. Eight is the only digit 
           that is completely useless, whereas _one_, _four_ and _seven_ can be effectively used to decode 
           all other digits, in combination with their corresponding `len`.
+          Patterns are encoded as 7-bit masks (one bit per segment), so that `len` is the `bit_count` of the mask,
+          and the segments shared with another pattern is the `bit_count` of the `&` of the masks.
+          The number of segments, and of those shared with _one_, _four_ and _seven_ is the `signature` of a digit,
+          which does not depend on how segments are wired. Therefore signatures are calculated once,
+          on the original wiring (`SIGNATURES`), and each pattern is decoded by a simple lookup.
           Last but not least, once decoded, patterns in the output (right handside of the game input) will 
           be processed and decifered, accordingly.
-          On this note, it's worth mentioning the use of [`frozenset`](https://docs.python.org/3/library/stdtypes.html?frozenset) as immutable sets in the decoding map.
 """
 
 __day__ = "08"
@@ -20,6 +24,8 @@ __author__ = "leriomaggio"
 
 from pathlib import Path
 from itertools import chain
+from functools import cache
+from typing import Iterable, Iterator
 
 
 def load(lines: list[str]) -> tuple[list[str], list[str]]:
@@ -43,89 +49,66 @@ def part1(data: tuple[list[str], list[str]]) -> int:
 
 # =========== Part 2 ============
 
-
-def one(msg: str) -> bool:
-    return len(msg) == 2
-
-
-def four(msg: str) -> bool:
-    return len(msg) == 4
-
-
-def seven(msg: str) -> bool:
-    return len(msg) == 3
-
-
-def eight(msg: str) -> bool:
-    return len(msg) == 7
-
-
-def two(msg: str, one_pattern: str, four_pattern: str, seven_pattern: str) -> bool:
-    return (
-        len(msg) == 5
-        and len(set(seven_pattern).intersection(msg)) == 2
-        and len(set(four_pattern).difference(one_pattern).intersection(msg)) == 1
-    )
-
-
-def three(msg: str, seven_pattern: str) -> bool:
-    return len(msg) == 5 and len(set(seven_pattern).intersection(msg)) == 3
-
-
-def five(msg: str, one_pattern, four_pattern) -> bool:
+# Segments of each digit, with the original (i.e. not scrambled) wiring
+DIGITS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+@cache  # i.e. patterns are (a few thousands of) permutations of segments
+def mask(pattern: str) -> int:
+    """Pattern as a 7-bit mask, one bit per segment"""
+    return sum(1 << (ord(s) - ord("a")) for s in pattern)
+
+
+def signature(pattern: int, one: int, four: int, seven: int) -> int:
+    """Number of segments of pattern, and of those shared with 1, 4, and 7,
+    packed in a single integer (each count is at most 7)"""
     return (
-        len(msg) == 5
-        and len(set(four_pattern).difference(one_pattern).intersection(msg)) == 2
+        pattern.bit_count() << 9
+        | (pattern & one).bit_count() << 6
+        | (pattern & four).bit_count() << 3
+        | (pattern & seven).bit_count()
     )
 
 
-def zero(msg: str, four_pattern: str, seven_pattern: str) -> bool:
-    return (
-        len(msg) == 6
-        and len(set(seven_pattern).intersection(msg)) == 3
-        and len(set(four_pattern).difference(msg)) == 1
-    )
+# Signatures do not depend on the wiring, so they identify the digits of any entry
+MASKS = tuple(map(mask, DIGITS))
+SIGNATURES = {
+    signature(m, MASKS[1], MASKS[4], MASKS[7]): d for d, m in enumerate(MASKS)
+}
+assert len(SIGNATURES) == len(DIGITS)
 
 
-def six(msg: str, four_pattern: str, seven_pattern: str) -> bool:
-    return (
-        len(msg) == 6
-        and len(set(seven_pattern).intersection(msg)) == 2
-        and len(set(four_pattern).difference(msg)) == 1
-    )
+def decode(patterns: list[str], message: list[str]) -> int:
+    masks = list(map(mask, patterns))
+    known = {m.bit_count(): m for m in masks}  # i.e. digits with a unique length
+    one, four, seven = known[2], known[4], known[3]
+    digits = {m: SIGNATURES[signature(m, one, four, seven)] for m in masks}
+    value = 0
+    for pattern in message:
+        value = value * 10 + digits[mask(pattern)]
+    return value
 
 
-def nine(msg: str, four_pattern: str, seven_pattern: str) -> bool:
-    return (
-        len(msg) == 6
-        and len(set(four_pattern).intersection(msg)) == len(four_pattern)
-        and len(set(seven_pattern).intersection(msg)) == len(seven_pattern)
-    )
+def decode_all(lines: Iterable[str]) -> Iterator[int]:
+    """Decode many display entries (i.e. lines as in the input), one at a time"""
+    for line in lines:
+        patterns, message = line.split("|")
+        yield decode(patterns.split(), message.split())
 
 
 def part2(data: tuple[list[str], list[str]]) -> int:
-    line_outputs = list()
-    input_digits, output_messages = data
-    for patterns, message in zip(input_digits, output_messages):
-        digits = {}
-        digits[1] = next(filter(one, patterns))
-        digits[4] = next(filter(four, patterns))
-        digits[7] = next(filter(seven, patterns))
-        digits[8] = next(filter(eight, patterns))
-
-        digits[3] = next(filter(lambda p: three(p, digits[7]), patterns))
-        digits[5] = next(filter(lambda p: five(p, digits[1], digits[4]), patterns))
-        digits[2] = next(
-            filter(lambda p: two(p, digits[1], digits[4], digits[7]), patterns)
-        )
-
-        digits[0] = next(filter(lambda p: zero(p, digits[4], digits[7]), patterns))
-        digits[6] = next(filter(lambda p: six(p, digits[4], digits[7]), patterns))
-        digits[9] = next(filter(lambda p: nine(p, digits[4], digits[7]), patterns))
-
-        decode_map = {frozenset(v): str(k) for k, v in digits.items()}
-        line_outputs.append(int("".join([decode_map[frozenset(p)] for p in message])))
-    return sum(line_outputs)
+    return sum(map(decode, *data))
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, decode_all
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -57,6 +57,12 @@ class TestPartTwo(AoCTest):
         LOGGER.info(f"Part 2: Test Input")
         assert part2(sample_input) == 61229, f"Part 2 - Test Input ❌"
 
+    def test_decode_all_on_sample_data(self):
+        LOGGER.info(f"Part 2: Test Input (Batch)")
+        values = list(decode_all(EXAMPLE_DATA.splitlines()))
+        assert values[:3] == [8394, 9781, 1197], f"Part 2 - Test Input (Batch) ❌"
+        assert sum(values) == 61229, f"Part 2 - Test Input (Batch) ❌"
+
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 982158, f"Part 2 - Game Input ❌"
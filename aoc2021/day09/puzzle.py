@@ -2,108 +2,129 @@
 Day 09, https://adventofcode.com/2021/day/9
 
 Notes on Solutions:
-- Part 1: I had lots of fun in implementing the two parts of this challenge in a _functional_
-          fashion, both for Part 1 and 2. For this reason, the area of basins is implemented 
-          as a dictionary of coordinates: *not* the most efficient data abstraction possible
-          (being the area a dense matrix, and not a sparse one), but preferrable IMO over the
-          list of lists for readability (esp. in functional iterations).
-
-          Crucial to this part (and the next) is the `neighbourood` function. This 
-          function generates the `n, s, w, e` pair of coordinates for an input `coord`
-          making sure that resulting coordinates are within the `shape` of the area 
-          (i.e. `borders`). This is done by using `le` and `lt` functions from the
-          [`operator`](https://docs.python.org/3/library/operator.html#module-operator)
-          module, in combination with 
-          [`starmap`](https://docs.python.org/3/library/itertools.html#itertools.starmap) 
-          which applies those operators on each pair of elements.
-
-          The `low_point_filter` function is predefined with `functools.partial`, pre-set
-          on `area` so that only coordinates could be passed in during the `filter` calls.
-
-- Part 2: This part is way more interesting (and more challenging). The idea is to implement
-          a BFS (Breadth-First Search) traversal over basins' area, interpreted as a graph.
-          The [`collections.deque`](https://docs.python.org/3/library/collections.html#collections.deque) (double-ended queue) is used to implement the FIFO queue required in BFS.
-          Interestingly, the search frontier is updated considering the neighbourhood of 
-          the current coordinates, filtered by BFS visit and height values of `9`.
+Both parts are solved by the `scan` function, in a single pass over the rows of the heightmap
+(from the `Grid`, or streamed from any iterable of lines, see `stream`), keeping only three rows
+in memory at any time: the one being scanned, along with the ones above and below.
+- Part 1: Low points of a row are found as soon as the row below is available (see `low_points`),
+          i.e. with a delay of one row. Locations outside the heightmap are a wall of `9`,
+          i.e. never lower, and never part of a basin.
+- Part 2: Basins are the _connected components_ of locations lower than `9`, labelled row by row:
+          each location takes the label of its neighbour on the left, or of the one above
+          (on the previous row). When both are labelled, the two labels belong to the same basin,
+          and so they are merged, using a [union-find](https://en.wikipedia.org/wiki/Disjoint-set_data_structure)
+          (by size, with path halving). Sizes are accumulated on the root label of each basin,
+          so there is no need to traverse (nor to store) any basin.
 """
 
 __day__ = "09"
 __title__ = "Smoke Basin"
 __author__ = "leriomaggio"
 
+import sys
 from pathlib import Path
-from itertools import starmap
-from operator import le, lt, and_
-from functools import partial
+from typing import Iterable, Optional, Sequence
 
 # -- part 2
-from collections import deque
 from functools import reduce
 from operator import mul
 
-
-def load(lines: list[str]) -> dict[tuple[int, int], int]:
-    # Caveat: Basins' Area is represented as a dictionary of
-    # coordinates. Not the most efficient data abstraction
-    # but easier to deal with in a functional way.
-    return {
-        (r, c): height
-        for r, line in enumerate(lines)
-        for c, height in enumerate(map(int, line))
-    }
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # shared modules
+from grid import Grid
+
+WALL = 9  # never lower, never part of a basin
+
+
+def load(lines: list[str]) -> Grid:
+    # Border of the grid is a wall of 9s
+    rows = (map(int, line.strip()) for line in lines if line.strip())
+    return Grid.from_rows(rows, border=WALL)
+
+
+def stream(lines: Iterable[str]) -> Iterable[list[int]]:
+    """Rows of the heightmap, one at a time (e.g. from a file)"""
+    return ([int(h) for h in line.strip()] for line in lines if line.strip())
+
+
+def low_points(
+    above: Optional[Sequence[int]], row: Sequence[int], below: Optional[Sequence[int]]
+) -> Iterable[int]:
+    """Heights of the low points in row, given the rows above and below (if any)"""
+    last = len(row) - 1
+    for c, height in enumerate(row):
+        if (
+            height < (above[c] if above else WALL)
+            and height < (below[c] if below else WALL)
+            and height < (row[c - 1] if c else WALL)
+            and height < (row[c + 1] if c < last else WALL)
+        ):
+            yield height
+
+
+def scan(rows: Iterable[Sequence[int]]) -> tuple[list[int], list[int]]:
+    """Heights of all the low points, and sizes of all the basins, in a single
+    pass over the rows of the heightmap. Only three rows are kept at any time.
+    Basins are labelled row by row, merging labels with a union-find."""
+    parent, size = list(), list()
+
+    def find(label: int) -> int:
+        while parent[label] != label:
+            parent[label] = label = parent[parent[label]]  # i.e. path halving
+        return label
+
+    def union(a: int, b: int) -> int:
+        a, b = find(a), find(b)
+        if a == b:
+            return a
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b], size[a] = a, size[a] + size[b]
+        return a
+
+    lows, above, current, labels_above = list(), None, None, None
+    for row in rows:
+        labels = [-1] * len(row)
+        for c, height in enumerate(row):
+            if height == WALL:
+                continue
+            left = labels[c - 1] if c else -1
+            up = labels_above[c] if labels_above else -1
+            if left < 0 and up < 0:
+                label = len(parent)
+                parent.append(label)
+                size.append(0)
+            elif left < 0 or up < 0:
+                label = find(max(left, up))
+            else:
+                label = union(left, up)
+            labels[c] = label
+            size[label] += 1
+        if current is not None:
+            lows.extend(low_points(above, current, row))
+        above, current, labels_above = current, row, labels
+    if current is not None:
+        lows.extend(low_points(above, current, None))
+    basins = [size[label] for label, p in enumerate(parent) if label == p]
+    return lows, basins
+
+
+def rows(area: Grid) -> Iterable[Sequence[int]]:
+    return (area.row(r) for r in range(area.nrows))
 
 
 # =========== Part 1 ============
 
 
-def neighbourhood(coord, borders):
-    n, s, w, e = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # 883
-    return filter(
-        lambda l: and_(*starmap(le, zip((0, 0), l)))
-        and and_(*starmap(lt, zip(l, borders))),
-        map(lambda d: tuple(map(sum, zip(coord, d))), (n, s, w, e)),
-    )
-
-
-def shape(area: dict[tuple[int], int]) -> tuple[int]:
-    return (max(l + 1 for l, _ in area), max(r + 1 for _, r in area))
-
-
-def is_low_point(coord, area, shape):
-    return all(
-        map(
-            lambda v: v > area[coord],
-            map(lambda l: area[l], neighbourhood(coord, shape)),
-        )
-    )
-
-
-def part1(area: dict[tuple[int, int], int]) -> int:
-    shape_ = shape(area)
-    low_point_filter = partial(is_low_point, area=area, shape=shape_)
-    return sum(area[c] + 1 for c in filter(lambda c: low_point_filter(coord=c), area))
+def part1(area: Grid) -> int:
+    lows, _ = scan(rows(area))
+    return sum(height + 1 for height in lows)
 
 
 # =========== Part 2 ============
 
 
-def part2(area: dict[tuple[int, int], int]) -> int:
-    shape_ = shape(area)
-    marked = set()  # set of tuples, i.e. coordinates
-    basin_filter = lambda l: l not in marked and area[l] != 9
-
-    def traverse_basin(r, c):
-        basin, nodes = list(), deque([(r, c)])
-        while nodes:
-            if (coord := nodes.popleft()) in marked:
-                continue
-            marked.add(coord)
-            basin.append(coord)
-            nodes += filter(basin_filter, neighbourhood(coord, shape_))
-        return basin
-
-    basins = [traverse_basin(r, c) for r, c in filter(basin_filter, area)]
-    return reduce(mul, sorted(map(len, basins), reverse=True)[:3])
+def part2(area: Grid) -> int:
+    _, basins = scan(rows(area))
+    return reduce(mul, sorted(basins, reverse=True)[:3])
 
 
 if __name__ == "__main__":
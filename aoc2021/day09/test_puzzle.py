@@ -1,10 +1,11 @@
 """Test Module for Puzzles in Day 09: Smoke Basin"""
 
+import io
 import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, scan, stream
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -55,3 +56,21 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 1280496, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestScan(AoCTest):
+    def test_scan_stream_on_sample_data(self):
+        LOGGER.info(f"Part 1 and 2: Test Input (Stream)")
+        lows, basins = scan(stream(io.StringIO(EXAMPLE_DATA)))
+        assert sorted(lows) == [0, 1, 5, 5], f"Low Points - Test Input ❌"
+        assert sorted(basins) == [3, 9, 9, 14], f"Basins - Test Input ❌"
+
+    def test_scan_stream_on_game_input(self, game_input):
+        LOGGER.info(f"Part 1 and 2: Game Input (Stream)")
+        with open(Path(__file__).with_name(f"input.{__day__}")) as lines:
+            lows, basins = scan(stream(lines))
+        assert sum(height + 1 for height in lows) == part1(game_input)
+        assert len(basins) == len(lows)  # one basin per low point
@@ -4,30 +4,37 @@ Day 11, https://adventofcode.com/2021/day/11
 Notes on Solutions:
 - Part 1: Solution to this part is a combination of Solution to Day 06 "Lanterfish", 
           combined with Day 09 "Smoke Basin" for neighbourhood inspection.
-          The latter expands on the neighbourhood calculation by also including diagonals.
-          This is pretty easily achieved by using this time `itertools.product` in combination
-          with the same strategy for checking boundaries.
+          The latter expands on the neighbourhood calculation by also including diagonals,
+          i.e. the `offsets8` of the shared `Grid` (see `grid.py`).
           Similarly to the Lanterfish case, flashing are counted and simulated, rather than explicitly
-          enumerated.
+          enumerated: octopus reaching an energy level of `10` are pushed on a stack, and 
+          their energy is reset to `0` when they flash. This way, flashed octopus
+          (and the border of the grid, i.e. `-1`) are never bumped up again in the same step.
 - Part 2: Part 2 is identical to Part 1, with the only difference that we need to return the step when all 
-          Octopus are off. This is achieved by using `all` on `area.values()` in combination with the 
-          `operator.not_` function, which implements the logical not operator.
-          This works due to how Python treats `bool` and `int` types: `not(3)==False` whereas `not(0) == True`.
-          So when all values are zeros (i.e. `all(not, values)`), the execution breaks, and function returns.
+          Octopus flash at the same time, i.e. the number of flashes equals the size of the grid.
+
+Both parts run on NumPy (if installed) via `step_array`, which works on the whole board at once:
+the flashing octopus of each _wave_ are a boolean mask, and the energy they spread is the sum of
+the mask shifted in the eight directions (i.e. a convolution with a 3x3 kernel of ones, centre excluded).
+Waves stop when no new octopus gets above `9`. This makes (very) big boards and long simulations
+feasible, whereas the pure Python `step` is used as fallback (or forced with `use_numpy=False`).
 """
 
 __day__ = "11"
 __title__ = "Dumbo Octopus"
 __author__ = "leriomaggio"
 
-from typing import Union
+import sys
+from typing import Callable, Optional, Union
 from pathlib import Path
-from itertools import starmap
-from operator import le, lt, and_
-from itertools import repeat, product
 
-# -- part 2
-from operator import not_
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # shared modules
+from grid import Grid
+
+try:
+    import numpy as np
+except ImportError:  # pure Python engine only
+    np = None
 
 
 def load(filepath: Union[str, Path]):
@@ -37,65 +44,76 @@ def load(filepath: Union[str, Path]):
 # =========== Part 1 ============
 
 
-def neighbourhood(coord, borders):
-    nw, n, ne, w, _, e, sw, s, se = tuple(product((-1, 0, 1), repeat=2))
-    return filter(
-        lambda l: and_(*starmap(le, zip((0, 0), l)))
-        and and_(*starmap(lt, zip(l, borders))),
-        map(lambda n: tuple(map(sum, zip(coord, n))), (n, s, w, e, nw, ne, sw, se)),
-    )
-
-
-def shape(area: dict[tuple[int], int]) -> tuple[int]:
-    return (max(l + 1 for l, _ in area), max(r + 1 for _, r in area))
-
-
-def part1(board: list[list[int]]) -> int:
+def step(area: Grid) -> int:
+    """Simulate a single step, returning the number of flashes"""
+    energy, offsets = area.cells, area.offsets8
+    flashing = list()
+    for c in area:
+        energy[c] += 1
+        if energy[c] > 9:
+            flashing.append(c)
     flashes = 0
-    area = {(r, c): v for r, row in enumerate(board) for c, v in enumerate(row)}
-    shape_ = shape(area)
-
-    for _ in range(100):
-        area.update(zip(area.keys(), map(lambda v: v + 1, area.values())))
-        flashing = list(filter(lambda c: area[c] > 9, area))
-        marked = set()
-        while flashing:
-            flashes += len(flashing)
-            marked |= set(flashing)
-            area.update(zip(flashing, repeat(0, len(flashing))))
-            for fc in flashing:
-                for neigh in filter(
-                    lambda n: n not in marked, neighbourhood(fc, shape_)
-                ):
-                    area[neigh] += 1
-            flashing = list(filter(lambda c: area[c] > 9 and not c in marked, area))
+    while flashing:
+        fc = flashing.pop()
+        energy[fc] = 0  # i.e. flashed, at most once per step
+        flashes += 1
+        for offset in offsets:
+            # border (-1) and flashed octopus (0) are left untouched
+            if energy[n := fc + offset] > 0:
+                energy[n] += 1
+                if energy[n] == 10:
+                    flashing.append(n)
     return flashes
 
 
+def step_array(energy: "np.ndarray", padded: "np.ndarray") -> int:
+    """Simulate a single step on the whole (NumPy) array, returning the number of flashes.
+    padded is a zero-bordered buffer, two rows and columns larger than energy."""
+    nrows, ncols = energy.shape
+    energy += 1
+    flashed = np.zeros(energy.shape, dtype=bool)
+    while (flashing := (energy > 9) & ~flashed).any():
+        flashed |= flashing
+        # convolution with a 3x3 kernel of ones (centre excluded), via shifted views
+        padded[1:-1, 1:-1] = flashing
+        for dr in range(3):
+            for dc in range(3):
+                if dr != 1 or dc != 1:
+                    energy += padded[dr : dr + nrows, dc : dc + ncols]
+    energy[flashed] = 0
+    return int(np.count_nonzero(flashed))
+
+
+def engine(
+    board: list[list[int]], use_numpy: Optional[bool] = None
+) -> Callable[[], int]:
+    """Return a function simulating one step (and returning the number of flashes)
+    on a copy of the board. NumPy is used when available, unless use_numpy says otherwise."""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy:
+        area = Grid.from_rows(board)
+        return lambda: step(area)
+    energy = np.array(board, dtype=np.int16)  # up to 9 + 8 neighbours
+    padded = np.zeros((energy.shape[0] + 2, energy.shape[1] + 2), dtype=np.int16)
+    return lambda: step_array(energy, padded)
+
+
+def part1(board: list[list[int]], use_numpy: Optional[bool] = None) -> int:
+    step_once = engine(board, use_numpy)
+    return sum(step_once() for _ in range(100))
+
+
 # =========== Part 2 ============
 
 
-def part2(board: list[list[int]]) -> int:
-    area = {(r, c): v for r, row in enumerate(board) for c, v in enumerate(row)}
-    shape_ = shape(area)
-    step = 0
-    while True:
-        step += 1
-        area.update(zip(area.keys(), map(lambda v: v + 1, area.values())))
-        flashing = list(filter(lambda c: area[c] > 9, area))
-        marked = set()
-        while flashing:
-            marked |= set(flashing)
-            area.update(zip(flashing, repeat(0, len(flashing))))
-            for fc in flashing:
-                for neigh in filter(
-                    lambda n: n not in marked, neighbourhood(fc, shape_)
-                ):
-                    area[neigh] += 1
-            flashing = list(filter(lambda c: area[c] > 9 and not c in marked, area))
-
-        if all(map(not_, area.values())):
-            return step
+def part2(board: list[list[int]], use_numpy: Optional[bool] = None) -> int:
+    step_once = engine(board, use_numpy)
+    size = len(board) * len(board[0])
+    n_step = 1
+    while step_once() != size:
+        n_step += 1
+    return n_step
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, np
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -59,3 +59,14 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 220, f"Part 2 - Game Input ❌"
+
+
+# ----- Engines -----
+
+
+@mark.skipif(np is None, reason="NumPy is not installed")
+class TestEngines(AoCTest):
+    def test_numpy_engine_matches_pure_python(self, game_input):
+        LOGGER.info(f"NumPy vs Pure Python Engine")
+        assert part1(game_input, use_numpy=True) == part1(game_input, use_numpy=False)
+        assert part2(game_input, use_numpy=True) == part2(game_input, use_numpy=False)
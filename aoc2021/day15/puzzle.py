@@ -6,29 +6,25 @@ Notes on Solutions:
           path of a DAG (Directed Acyclic Graph), which can be determined in linear time wrt. to 
           the size of the Graph. Indeed this is a slightly simplified version as the graph is not
           dense, and connections only go in two possible directions (considering the input maze).
-          As for the proposed solution, the shortest path is calculated using a recursive 
-          algorithm **with memoization** 
-          (using [`functools.cache`](https://docs.python.org/3/library/functools.html?#functools.cache)
-          A do personally find the recursive solution very elegant, as it's shorter, easier to read, 
-          and does not require using the topological sort (**thanks to memoization**) which would be 
-          required by the iterative version. 
-          Another fun part in this solution, is the `Graph` abstraction which leverages on the 
-          Python Data Model to implement a more Python graph structure
+          As for the proposed solution, the shortest path is calculated by Dynamic Programming,
+          filling the table bottom-up (i.e. from the bottom-right corner), one row at a time.
+          The grid is already in topological order, so no sort is required, and only the row
+          below is kept in memory. (A recursive solution with memoization is shorter,
+          but it hits the recursion limit as soon as the cavern gets a bit larger.)
+          The `Cavern` class stores risk levels in a flat `array`, and calculates the
+          risk levels of the tiles on the fly (see Part 2).
 
 - Part 2: Solution to Part 2 is more general, as it in fact implements a unique solution to part 1 too.
           This time, the [Dijkstra Algorithm](https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm) 
-          for shortest paths is used, generalised to a DAG `n`-times bigger (default `5 times`).
-          The Dijkstra algorithm adopts a priority queue 
-          ([`heapq`](https://docs.python.org/3/library/heapq.html#heapq.heappop))
-          to implement the visit frontier at each step, along with a set (i.e. `S`) of visited nodes
-          to bound the computation.
-          A `DAG` graph class is used (subclassing `Graph` of Part 1) which includes the general 
-          tiling for _all_ `chitons`, and the calculation of the `neighbourhood` for a pair of
-          coordinates in the four cardinal directions (i.e. `N, S, W, E`).
-          Interestingly, the `neighbourhood` function is the **same** already used on `day09` which 
-          was also _specialised_ on `day11`.
-          Please see _Day09 TOP NOTES_ for further details on the _quite convoluted_ implementation 
-          of that `neighbourhood` function (in an eccessive functional take! :D)
+          for shortest paths is used, generalised to a cavern `n`-times bigger (default `5 times`).
+          The tiled cavern is never materialised, as the risk of each position is derived
+          from the original one, and the (row, col) of the tile it belongs to.
+          Since risk levels are small integers (`1-9`), the priority queue is a _bucket queue_
+          ([Dial's algorithm](https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants)):
+          a list of positions per distance, and only 10 of them are needed at any time,
+          which are then reused circularly. Distances are kept in a flat `array` (`-1` for not
+          yet reached), so no set of visited nodes is needed: stale entries in the buckets
+          are simply skipped.
 """
 
 __day__ = "15"
@@ -36,16 +32,10 @@ __title__ = "Chiton"
 __author__ = "leriomaggio"
 
 
+from array import array
 from pathlib import Path
-from functools import cache
-from operator import sub
-from itertools import chain
-from collections import defaultdict
 
-# part 2
-from operator import and_, le, lt
-from itertools import starmap
-from heapq import heappop, heappush
+inf = float("inf")
 
 
 def load(lines: list[str]) -> list[list[int]]:
@@ -55,100 +45,90 @@ def load(lines: list[str]) -> list[list[int]]:
 # =========== Part 1 ============
 
 
-class Graph:
-    def __init__(self, nodes: list[list[int]]) -> None:
-        self.nodes = tuple(tuple(r) for r in nodes)
-        self._code = None
-
-    @property
-    def shape(self) -> tuple[int, int]:
-        return len(self.nodes), len(self.nodes[0])
+class Cavern:
+    """Risk levels of the cavern, tiled `tiles` times in both directions.
+    Cells are identified by their flat (row-major) index in the **tiled** cavern,
+    and risk levels of tiles are calculated on the fly, rather than materialised."""
 
-    @property
-    def limits(self) -> tuple[int, int]:
-        return tuple(map(lambda p: sub(*p), zip(self.shape, (1, 1))))
+    def __init__(self, nodes: list[list[int]], tiles: int = 1) -> None:
+        self.R, self.C = len(nodes), len(nodes[0])
+        self.tiles = tiles
+        self.nrows, self.ncols = self.R * tiles, self.C * tiles
+        self.risks = array("b", (risk for row in nodes for risk in row))
+        # (offset in the original risks, increment of the tile) per row and col
+        self.rows = [((r % self.R) * self.C, r // self.R) for r in range(self.nrows)]
+        self.cols = [(c % self.C, c // self.C) for c in range(self.ncols)]
 
-    def __getitem__(self, index: tuple[int, int]) -> int:
-        r, c = index
-        return self.nodes[r][c]
+    def index(self, r: int, c: int) -> int:
+        return r * self.ncols + c
 
-    def __contains__(self, index: tuple[int, int]) -> bool:
-        (r, c), (R, C) = index, self.shape
-        return 0 <= r < R and 0 <= c < C
+    def risk(self, r: int, c: int) -> int:
+        (offset, r_inc), (col, c_inc) = self.rows[r], self.cols[c]
+        return (self.risks[offset + col] + r_inc + c_inc - 1) % 9 + 1
 
-    def __hash__(self) -> int:  # necessary for cache
-        if not self._code:
-            self._code = sum(map(hash, chain.from_iterable(self.nodes)))
-        return self._code
+    def __getitem__(self, index: int) -> int:
+        return self.risk(*divmod(index, self.ncols))
 
-
-inf = float("inf")
+    def __len__(self) -> int:
+        return self.nrows * self.ncols
 
 
-@cache
-def dist(G: Graph, r: int, c: int):
-    if (r, c) not in G:
-        return inf
-    if (r, c) == G.limits:
-        return G[(r, c)]
-    return G[(r, c)] + min(dist(G, r + 1, c), dist(G, r, c + 1))
+def dist(cave: Cavern, r: int, c: int) -> int:
+    """Lowest total risk from (r, c) to the bottom-right corner (both included),
+    only moving down or right. Iterative DP, one row at a time (bottom-up)."""
+    best = [inf] * cave.ncols  # i.e. from the row below
+    best[-1] = 0  # i.e. past the bottom-right corner
+    for rr in range(cave.nrows - 1, r - 1, -1):
+        right = inf
+        for cc in range(cave.ncols - 1, c - 1, -1):
+            right = best[cc] = cave.risk(rr, cc) + min(best[cc], right)
+    return best[c]
 
 
 def part1(nodes: list[list[int]], s: tuple[int, int] = (0, 0)):
-    graph = Graph(nodes)
-    return dist(graph, *s) - graph[s]
+    cave = Cavern(nodes)
+    return dist(cave, *s) - cave.risk(*s)
 
 
 # =========== Part 2 ============
 
 
-class DAG(Graph):
-    def __init__(self, nodes, size: int = 1):
-        super(DAG, self).__init__(nodes=nodes)
-        self.tiles = size
-        R, C = self.shape
-
-        self.chitons = [
-            [
-                (self.nodes[r % R][c % C] + (r // R) + (c // C) - 1) % 9 + 1
-                for c in range(self.tiles * C)
-            ]
-            for r in range(self.tiles * R)
-        ]
-
-    def neighbours(self, r, c):
-        n, s, w, e = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        borders = tuple(map(lambda s: s * self.tiles, self.shape))
-        neighbours = filter(
-            lambda l: and_(*starmap(le, zip((0, 0), l)))
-            and and_(*starmap(lt, zip(l, borders))),
-            map(lambda n: tuple(map(sum, zip((r, c), n))), (n, s, w, e)),
-        )
-        for rr, cc in neighbours:
-            yield rr, cc
-
-
-def dijkstra(G: DAG, s: tuple[int, int]):
-    R, C = tuple(map(lambda s: s * G.tiles, G.shape))
-    D, Q, S = [[inf for _ in range(C)] for _ in range(R)], [(0, *s)], set()
-    while Q:
-        d, r, c = heappop(Q)
-        if (r, c) in S:
-            continue
-        S.add((r, c))
-        if (rc_cost := d + G.chitons[r][c]) < D[r][c]:
-            D[r][c] = rc_cost
-            if (r, c) == (R - 1, C - 1):
-                return D[r][c] - D[0][0]
-        else:
-            continue
-        for rr, cc in G.neighbours(r, c):
-            heappush(Q, (D[r][c], rr, cc))
+def dijkstra(cave: Cavern, s: tuple[int, int]) -> int:
+    """Dijkstra with a bucket queue (i.e. Dial's algorithm): risks are in 1-9,
+    so pending distances are always within 10 consecutive values, and
+    10 buckets are reused circularly."""
+    W, H = cave.ncols, cave.nrows
+    target = cave.index(H - 1, W - 1)
+    D = array("i", [-1]) * len(cave)  # i.e. not reached yet
+    source = cave.index(*s)
+    D[source] = 0
+    buckets = [list() for _ in range(10)]
+    buckets[0].append(source)
+    d, pending = 0, 1
+    while pending:
+        bucket = buckets[d % 10]
+        while bucket:
+            i = bucket.pop()
+            pending -= 1
+            if D[i] != d:
+                continue  # stale entry
+            if i == target:
+                return d
+            r, c = divmod(i, W)
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < H and 0 <= nc < W:
+                    n = i + (nr - r) * W + (nc - c)
+                    nd = d + cave.risk(nr, nc)
+                    if D[n] < 0 or nd < D[n]:
+                        D[n] = nd
+                        buckets[nd % 10].append(n)
+                        pending += 1
+        d += 1
 
 
 def part2(nodes: list[list[int]], s: tuple[int, int] = (0, 0), size: int = 5) -> int:
-    dag = DAG(nodes, size=size)
-    return dijkstra(dag, s)
+    cave = Cavern(nodes, tiles=size)
+    return dijkstra(cave, s)
 
 
 if __name__ == "__main__":
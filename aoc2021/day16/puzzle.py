@@ -3,23 +3,23 @@ Day 16, https://adventofcode.com/2021/day/16
 
 Notes on Solutions:
 - Part 1 and 2: Solutions to Part 1 and 2 are essentially the same, and implemented as part of the `Decoder` class.
-    Solution to this challenge relies on a framework of mutually-recursive methods, which are in turn applied
-    to each corresponding substring of packets to be decoded. 
-    The base case of the recursion is of course when a literal packet is found. Therefore, the `bin_literal` is 
-    calculated, and converted into value to be returned. Each literal packet should be (generally) enclosed within
-    operational packets which in turns read literals, or any other operation packets, recursively.
-    Once submessages have been decoded, values are collected and treated accordingly to the `OPERATION_MAP`.
+    The message is never expanded into a string of `0`/`1`: the `BitReader` reads bits straight from the
+    bytes of the message, moving a _bit cursor_ forward (i.e. no substring is ever copied).
+    Packets are decoded in a single pass, with an explicit stack (rather than recursion) of the
+    operator packets still pending. Each entry keeps the values of the sub-packets decoded so far,
+    and the condition to complete the packet, i.e. the position of its last bit (length type `0`), or
+    its number of sub-packets (length type `1`).
+    Whenever a (literal) packet is complete, its value is added to the operator on top of the stack,
+    which in turn may get complete, and evaluated accordingly to the `OPERATOR_MAP`, and so on.
     As per the solution itself, two points maybe of interest:
     1) Once a `Decoder` instance has been created on a given message, its value is calculated and stored 
     in the `decode` method. This is to avoid decoding multiple times the same string.
     Note: this is of no interest for the challenge, just an example of good object encapsulation. This is 
     merely because each `decoder` instance makes sense for one and only one input `HEX` message.
+    Many transmissions can be decoded at once with `decode_all`.
 
-    2) When calculating the `bin_literal` for literal packets, the 
-    [`itertools.takewhile`](https://docs.python.org/3/library/itertools.html#itertools.takewhile) function 
-    is used which in turn takes sub-portions of the input message with step `5` until a `0` initial bit 
-    (i.e. **stop** bit is found). In that case, the last sequence is also added in, and the whole `bin_literal`
-    finally converted.
+    2) Literal values are read in groups of `5` bits until a `0` initial bit (i.e. **stop** bit) is found,
+    shifting the value `4` bits at a time.
 """
 
 __day__ = "16"
@@ -27,10 +27,9 @@ __title__ = "Packet Decoder"
 __author__ = "leriomaggio"
 
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Union
 from functools import reduce
 from operator import mul
-from itertools import takewhile
 
 
 def load(filepath: Union[str, Path]):
@@ -40,6 +39,24 @@ def load(filepath: Union[str, Path]):
 # =========== Part 1 ============
 
 
+class BitReader:
+    """Reads (big-endian) bits from a bytes buffer, moving a bit cursor forward"""
+
+    def __init__(self, buffer: bytes):
+        self.buffer = buffer
+        self.pos = 0
+
+    @classmethod
+    def from_hex(cls, msg: str) -> "BitReader":
+        return cls(bytes.fromhex(msg if len(msg) % 2 == 0 else msg + "0"))
+
+    def read(self, nbits: int) -> int:
+        start, end = self.pos, self.pos + nbits
+        chunk = int.from_bytes(self.buffer[start >> 3 : (end + 7) >> 3], "big")
+        self.pos = end
+        return (chunk >> (-end % 8)) & ((1 << nbits) - 1)
+
+
 class Decoder:
 
     OPERATOR_MAP = {
@@ -54,55 +71,54 @@ class Decoder:
 
     def __init__(self, msg: str):
         self.msg = msg
-        self.versions: list[str] = list()
+        self.versions: list[int] = list()
         self.value: int = -1
 
     def decode(self):
         if self.value < 0:  # this is to avoid decoding the same message multiple times
-            bin_msg = "".join(
-                map(lambda c: str(bin(int(c, base=16)))[2:].zfill(4), self.msg)
-            )
-            _, self.value = self._decode(bin_msg)
+            self.value = self._decode(BitReader.from_hex(self.msg))
         return self.value
 
-    def _decode_literal_packet(self, message: str) -> tuple[str, int]:
-        bin_literal = "".join(
-            map(
-                lambda i: message[i + 1 : i + 5],
-                takewhile(lambda i: message[i] != "0", range(0, len(message), 5)),
-            )
-        )
-        bin_literal += message[5 * (lb := len(bin_literal) // 4) + 1 : 5 * lb + 5]
-        return message[5 * lb + 5 :], int(bin_literal, 2)
-
-    def _decode_operator_packet(
-        self, message: str, packet_type: int
-    ) -> tuple[str, int]:
-        length_type_bit = int(message[0], base=2)
-        packet_values = list()
-        if length_type_bit == 0:
-            len_bits, message = int(message[1:16], base=2), message[16:]
-            starting_len, read_bits = len(message), 0
-            while read_bits != len_bits:
-                message, value = self._decode(message)
-                packet_values.append(value)
-                read_bits = starting_len - len(message)
-        else:  # length_type_bit is 1
-            n_packets, message = int(message[1:12], base=2), message[12:]
-            for _ in range(n_packets):
-                message, value = self._decode(message)
-                packet_values.append(value)
-        # eval
-        return message, self.OPERATOR_MAP[packet_type](packet_values)
-
-    def _decode(self, message: str) -> tuple[str, int]:
-        packet_version = int(message[0:3], base=2)
-        packet_type_ = int(message[3:6], base=2)
-        self.versions.append(packet_version)
-        if packet_type_ == 4:  # lit
-            return self._decode_literal_packet(message[6:])
-        else:
-            return self._decode_operator_packet(message[6:], packet_type_)
+    @staticmethod
+    def _decode_literal(bits: BitReader) -> int:
+        value, more = 0, 1
+        while more:
+            group = bits.read(5)
+            more, value = group >> 4, (value << 4) | (group & 0xF)
+        return value
+
+    def _decode(self, bits: BitReader) -> int:
+        # Pending operator packets: [type, values, end bit (length type 0), n. packets (1)]
+        stack = list()
+        while True:
+            self.versions.append(bits.read(3))
+            packet_type = bits.read(3)
+            if packet_type != 4:
+                if bits.read(1) == 0:
+                    length = bits.read(15)
+                    stack.append([packet_type, list(), bits.pos + length, None])
+                else:
+                    stack.append([packet_type, list(), None, bits.read(11)])
+                continue
+            value = self._decode_literal(bits)
+            # a packet is complete: close all the operator packets it completes, in turn
+            while stack:
+                packet_type, values, end, n_packets = stack[-1]
+                values.append(value)
+                if bits.pos != end and len(values) != n_packets:
+                    break
+                stack.pop()
+                value = self.OPERATOR_MAP[packet_type](values)
+            else:
+                return value
+
+
+def decode_all(messages: Iterable[str]) -> list[Decoder]:
+    """Decode many transmissions at once"""
+    decoders = [Decoder(msg) for msg in messages]
+    for decoder in decoders:
+        decoder.decode()
+    return decoders
 
 
 def part1(msg: str) -> int:
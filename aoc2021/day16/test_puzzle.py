@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, decode_all
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -70,6 +70,12 @@ class TestPartTwo(AoCTest):
         for entry, expected in sample_input:
             assert part2(entry) == expected, f"Part 2 - Test Input ❌"
 
+    def test_decode_all_on_sample_data(self, sample_input):
+        LOGGER.info(f"Part 2: Test Input (Batch)")
+        messages, expected = zip(*sample_input)
+        values = tuple(decoder.value for decoder in decode_all(messages))
+        assert values == expected, f"Part 2 - Test Input (Batch) ❌"
+
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 4358595186090, f"Part 2 - Game Input ❌"
@@ -3,78 +3,147 @@ Day 20, https://adventofcode.com/2021/day/20
 
 Notes on Solutions:
 - Solutions to Part 1 and Part 2 are essentially the same (only the value of the parameter `times` in 
-  the `enhance` function is different). Key to the solution are the `kernel_function` and the `enhance`
-  in combination with the input algorithm. The former is very similar to the functions to calculate 
-  the neighbourhood (see `Day09` or `Day11`, for example). However situation here is simpler as the
-  image area is supposed to be infinite, and therefore there is no actual limit on the ranges.
+  the `enhance` function is different). Key to the solution are the `kernel` and the `enhance`
+  in combination with the input algorithm. The former is very similar to the neighbourhood offsets
+  of the shared `Grid` (see `Day09` or `Day11`, for example), including the pixel itself.
+  No grid is needed here, though: each row of the image is packed into an integer
+  straight away (see `load`).
+  However situation here is simpler as the image area is supposed to be infinite, and therefore
+  there is no actual limit on the ranges.
   Secondly, key to the solution is understanding what happens at the (infinite) border, considering the 
   input algorithm. In my case, `algorithm` starts with `#` (i.e. `1`) and terminates on `511` with `.`.
   This means that (on odd-steps) all zeros become ones wich then turn back to zero in the next round!
-  The rest of the solution is just padding the image at each step, and considering the padded image to 
-  apply the `kernel` function.
+  The value of the infinite border is therefore tracked explicitly, and used to fill the canvas
+  all around the image, before each step.
+
+  Pixels are never enhanced one at a time: the whole image is bit-packed in a single integer
+  (rows of `stride` bits, on a canvas with room for the image to grow for a while), so that each of the nine
+  pixels of the window of **every** pixel is just the image shifted by the corresponding `kernel` offset.
+  The algorithm is a boolean function of those nine pixels, which `compile_algo` splits
+  (one pixel at a time, i.e. Shannon expansion) into a DAG of at most 511 `if-then-else` nodes,
+  sharing identical sub-tables. Each step then boils down to evaluating the DAG with
+  bitwise operations on the shifted images: `off ^ (pixel & (off ^ on))`.
 """
 
 __day__ = "20"
 __title__ = "Trench Map"
 __author__ = "leriomaggio"
 
-from typing import Union
+from collections import namedtuple
 from pathlib import Path
-from itertools import product
 
+# Rows of the image, bit-packed (the first column being the least significant bit)
+Image = namedtuple("Image", ["rows", "ncols"])
+BITS = str.maketrans(".#", "01")
 
-def load(lines: str) -> Union[str, dict[tuple[int, int], bool]]:
+
+def load(lines: str) -> tuple[str, Image]:
     algo, img_data = lines.strip("\n").split("\n\n")
-    img_array = {
-        (r, c): (e == "#")
-        for r, line in enumerate(img_data.splitlines())
-        for c, e in enumerate(line.strip())
-    }
-    return algo, img_array
+    rows = [line.strip()[::-1].translate(BITS) for line in img_data.splitlines()]
+    return algo, Image([int(row, base=2) for row in rows], len(rows[0]))
 
 
 # =========== Part 1 ============
 
 
-def kernel(img_array: dict[tuple[int, int], bool], r: int, c: int, border="0"):
-    filter = ""
-    for x, y in product((-1, 0, 1), repeat=2):
-        filter += str(int(img_array.get((r + x, c + y), border)))
-    return filter
-
-
-def pad(img_array: dict[tuple[int, int], bool]) -> set[tuple[int, int]]:
-    return {
-        (r + x, c + y) for r, c in img_array for x, y in product((-1, 0, 1), repeat=2)
-    }
-
-
-def enanche(img_array: dict[tuple[int, int], bool], algo: str, times: int = 2):
-    enhanced_img = None
-    border = "0"
-    for t in range(times):
-        enhanced_img = {}
-        padded_img = pad(img_array)
-        for r, c in padded_img:
-            mask = kernel(img_array, r, c, border=border)
-            enhanced_img[(r, c)] = int(algo[int(mask, base=2)] == "#")
-        img_array = enhanced_img
-        if algo[0] == "#":
-            border = "1" if (t % 2 == 0) else str(int(algo[511] == "#"))
-    return enhanced_img
-
-
-def part1(img_array: dict[tuple[int, int], bool], algo: str) -> int:
-    enhanced_img = enanche(img_array, algo, times=2)
-    return sum(enhanced_img.values())
+def kernel(stride: int) -> tuple[int]:
+    """Offsets of the 3x3 window, from the top-left (most significant bit) onward"""
+    return (-stride - 1, -stride, -stride + 1, -1, 0, 1, stride - 1, stride, stride + 1)
+
+
+def compile_algo(algo: str) -> list[tuple[int, int, int]]:
+    """Decompose the algorithm (i.e. a boolean function of the 9 pixels in the window)
+    into a DAG of `(pixel, if_off, if_on)` nodes, in evaluation order.
+    Node ids 0 and 1 are the constant functions, the last node is the whole algorithm."""
+    nodes, ids = list(), dict()
+
+    def node(table: bytes) -> int:
+        if not any(table) or all(table):
+            return table[0]
+        if table not in ids:
+            half = len(table) // 2
+            if_off, if_on = node(table[:half]), node(table[half:])
+            if if_off == if_on:
+                return if_off
+            nodes.append((9 - half.bit_length(), if_off, if_on))
+            ids[table] = len(nodes) + 1
+        return ids[table]
+
+    lookup = bytes(e == "#" for e in algo)
+    if (root := node(lookup)) < 2:  # constant algorithm
+        nodes.append((0, root, root))
+    return nodes
+
+
+def last_uses(dag: list[tuple[int, int, int]]) -> list[list[int]]:
+    """Ids of the nodes whose value is no longer needed, after evaluating each node"""
+    last = dict()
+    for i, (_, if_off, if_on) in enumerate(dag, start=2):
+        last[if_off] = last[if_on] = i
+    released = [list() for _ in dag]
+    for n, i in last.items():
+        if n > 1:
+            released[i - 2].append(n)
+    return released
+
+
+def enanche(img_array: Image, algo: str, times: int = 2) -> tuple[int, int]:
+    """Enhance the image, returning it as (packed pixels, value of the infinite border)"""
+    dag, lookup = compile_algo(algo), bytes(e == "#" for e in algo)
+    released = last_uses(dag)
+    rows, ncols = img_array
+    nrows, border = len(rows), 0
+    while True:
+        # the canvas has room for the image to grow (at least doubling its size)
+        # for a few steps, plus the border of the window; then it is repacked.
+        steps = min(times, max(nrows, ncols, 8))
+        margin = steps + 1
+        stride = ncols + 2 * margin
+        canvas = (1 << (stride * (nrows + 2 * margin))) - 1
+        pixels = region = 0
+        for r, row in enumerate(rows):
+            offset = (r + margin) * stride + margin
+            pixels |= row << offset
+            region |= ((1 << ncols) - 1) << offset
+        if not steps:
+            return pixels, border
+        window = kernel(stride)
+        for _ in range(steps):
+            padded = pixels | (canvas & ~region if border else 0)
+            shifted = [padded >> o if o >= 0 else padded << -o for o in window]
+            values = [0, -1] + [None] * len(dag)
+            for i, (pixel, if_off, if_on) in enumerate(dag, start=2):
+                off, on = values[if_off], values[if_on]
+                values[i] = off ^ (shifted[pixel] & (off ^ on))
+                for n in released[i - 2]:
+                    values[n] = None
+            # the enhanced image is one pixel larger all around
+            region |= (region << 1) | (region >> 1)
+            region |= (region << stride) | (region >> stride)
+            pixels = values[-1] & region
+            # pixels in the (infinite) border all turn into the same value
+            border = lookup[511 if border else 0]
+        times -= steps
+        nrows, ncols = nrows + 2 * steps, ncols + 2 * steps
+        row_mask = (1 << ncols) - 1
+        rows = [(pixels >> ((r + 1) * stride + 1)) & row_mask for r in range(nrows)]
+        # i.e. the enhanced image starts at (1, 1) of the canvas
+
+
+def lit(image: tuple[int, int]) -> int:
+    pixels, _ = image
+    return pixels.bit_count()
+
+
+def part1(img_array: Image, algo: str) -> int:
+    return lit(enanche(img_array, algo, times=2))
 
 
 # =========== Part 2 ============
 
 
-def part2(img_array: dict[tuple[int, int], bool], algo: str) -> int:
-    enhanced_img = enanche(img_array, algo, times=50)
-    return sum(enhanced_img.values())
+def part2(img_array: Image, algo: str) -> int:
+    return lit(enanche(img_array, algo, times=50))
 
 
 if __name__ == "__main__":
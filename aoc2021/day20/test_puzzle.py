@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, enanche, lit
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -61,3 +61,17 @@ class TestPartTwo(AoCTest):
         LOGGER.info(f"Part 2: Game Input")
         algo, img_array = game_input
         assert part2(img_array, algo) == 18269, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestEnhance(AoCTest):
+    def test_no_enhancement(self, sample_input, game_input):
+        LOGGER.info(f"No Enhancement")
+        for (algo, img_array), text in (
+            (sample_input, EXAMPLE_DATA),
+            (game_input, Path(__file__).with_name(f"input.{__day__}").read_text()),
+        ):
+            image = text.strip().split("\n\n")[1]
+            assert lit(enanche(img_array, algo, times=0)) == image.count("#")
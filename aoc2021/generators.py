@@ -0,0 +1,186 @@
+""" -- Advent of Code 2021 --
+Synthetic input generators, used by the benchmark suite (see `benchmark.py`).
+
+Each `dayNN(scale, rng)` function returns the text of a puzzle input
+which is (roughly) `scale` times the size of the original `input.NN`,
+in exactly the same format.
+Grids grow in both dimensions, i.e. each side is scaled by `sqrt(scale)`.
+
+`PARTS` lists the parts worth benchmarking on synthetic data, for those puzzles
+whose answer is not guaranteed to exist (or to depend on size) on random input.
+"""
+
+from math import ceil, log2, sqrt
+from random import Random
+
+PARTS = {"11": (1,)}
+
+
+def side(base: int, scale: float) -> int:
+    return max(1, round(base * sqrt(scale)))
+
+
+def grid(nrows: int, ncols: int, alphabet: str, rng: Random) -> str:
+    return "\n".join("".join(rng.choices(alphabet, k=ncols)) for _ in range(nrows))
+
+
+def day01(scale: float, rng: Random) -> str:
+    depth, depths = 150, list()
+    for _ in range(round(2000 * scale)):
+        depth = abs(depth + rng.randint(-10, 15))
+        depths.append(depth)
+    return "\n".join(map(str, depths))
+
+
+def day02(scale: float, rng: Random) -> str:
+    commands = rng.choices(
+        ("forward", "down", "up"), weights=(4, 4, 2), k=round(1000 * scale)
+    )
+    return "\n".join(f"{cmd} {rng.randint(1, 9)}" for cmd in commands)
+
+
+def has_rating(readings: list[int], nbits: int, least_common: bool) -> bool:
+    for bit in reversed(range(nbits)):
+        if len(readings) == 1:
+            break
+        ones = [r for r in readings if r >> bit & 1]
+        zeros = [r for r in readings if not r >> bit & 1]
+        readings = ones if (len(ones) >= len(zeros)) != least_common else zeros
+    return len(readings) > 0
+
+
+def day03(scale: float, rng: Random) -> str:
+    nbits = 12 + max(0, ceil(log2(scale)))
+    while True:  # the CO2 scrubber filter may end up with no readings at all
+        readings = rng.sample(range(2**nbits), k=round(1000 * scale))
+        if has_rating(readings, nbits, False) and has_rating(readings, nbits, True):
+            return "\n".join(f"{r:0{nbits}b}" for r in readings)
+
+
+def day04(scale: float, rng: Random) -> str:
+    pool = list(range(max(100, round(100 * scale))))
+    draws = pool[:]
+    rng.shuffle(draws)
+    width = len(str(pool[-1]))
+    boards = list()
+    for _ in range(round(100 * scale)):
+        numbers = rng.sample(pool, k=25)
+        boards.append(
+            "\n".join(
+                " ".join(f"{n:>{width}}" for n in numbers[r * 5 : (r + 1) * 5])
+                for r in range(5)
+            )
+        )
+    return ",".join(map(str, draws)) + "\n\n" + "\n\n".join(boards)
+
+
+def day05(scale: float, rng: Random) -> str:
+    span = side(1000, scale)
+    vents = list()
+    for _ in range(round(500 * scale)):
+        x1, y1 = rng.randrange(span), rng.randrange(span)
+        match rng.choice("hvd"):
+            case "h":
+                x2, y2 = rng.randrange(span), y1
+            case "v":
+                x2, y2 = x1, rng.randrange(span)
+            case "d":
+                dx, dy = rng.choice((-1, 1)), rng.choice((-1, 1))
+                reach = min(
+                    x1 if dx < 0 else span - 1 - x1, y1 if dy < 0 else span - 1 - y1
+                )
+                length = rng.randint(0, reach)
+                x2, y2 = x1 + dx * length, y1 + dy * length
+        vents.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(vents)
+
+
+def day06(scale: float, rng: Random) -> str:
+    return ",".join(map(str, rng.choices(range(1, 6), k=round(300 * scale))))
+
+
+def day07(scale: float, rng: Random) -> str:
+    span = side(2000, scale)
+    return ",".join(str(rng.randrange(span)) for _ in range(round(1000 * scale)))
+
+
+DIGITS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+def day08(scale: float, rng: Random) -> str:
+    entries = list()
+    for _ in range(round(200 * scale)):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", k=7)))
+        scramble = lambda d: "".join(
+            rng.sample([wiring[s] for s in DIGITS[d]], k=len(DIGITS[d]))
+        )
+        patterns = [scramble(d) for d in rng.sample(range(10), k=10)]
+        output = [scramble(d) for d in rng.choices(range(10), k=4)]
+        entries.append(f"{' '.join(patterns)} | {' '.join(output)}")
+    return "\n".join(entries)
+
+
+def day09(scale: float, rng: Random) -> str:
+    return grid(side(100, scale), side(100, scale), "0123456789", rng)
+
+
+def day11(scale: float, rng: Random) -> str:
+    return grid(side(10, scale), side(10, scale), "0123456789", rng)
+
+
+def day15(scale: float, rng: Random) -> str:
+    return grid(side(100, scale), side(100, scale), "123456789", rng)
+
+
+OPERATORS = (0, 1, 2, 3)  # sum, product, minimum, maximum
+COMPARISONS = (5, 6, 7)  # greater than, less than, equal to
+MAX_DEPTH = 8
+
+
+def literal(value: int, rng: Random) -> str:
+    groups = f"{value:b}"
+    groups = groups.zfill(ceil(len(groups) / 4) * 4)
+    nibbles = [groups[i : i + 4] for i in range(0, len(groups), 4)]
+    body = "".join(f"1{n}" for n in nibbles[:-1]) + f"0{nibbles[-1]}"
+    return f"{rng.randrange(8):03b}100{body}"
+
+
+def packet(budget: int, depth: int, rng: Random) -> str:
+    if budget < 60 or depth >= MAX_DEPTH:
+        return literal(rng.randrange(16), rng)
+    if budget < 200 and rng.random() < 0.3:
+        type_id, n_subpackets = rng.choice(COMPARISONS), 2
+    else:
+        levels = MAX_DEPTH - depth
+        n_subpackets = min(2047, max(2, round((budget / 60) ** (1 / levels))))
+        type_id = rng.choice(OPERATORS if n_subpackets <= 4 else (0, 2, 3))
+    subpackets = "".join(
+        packet(budget // n_subpackets, depth + 1, rng) for _ in range(n_subpackets)
+    )
+    if len(subpackets) < 2**15 and rng.random() < 0.5:
+        header = f"0{len(subpackets):015b}"
+    else:
+        header = f"1{n_subpackets:011b}"
+    return f"{rng.randrange(8):03b}{type_id:03b}{header}{subpackets}"
+
+
+def day16(scale: float, rng: Random) -> str:
+    bits = packet(round(5344 * scale), 0, rng)
+    bits = bits.ljust(ceil(len(bits) / 8) * 8, "0")
+    return f"{int(bits, base=2):0{len(bits) // 4}X}"
+
+
+def day20(scale: float, rng: Random) -> str:
+    algo = "#" + "".join(rng.choices("#.", k=510)) + "."
+    return algo + "\n\n" + grid(side(100, scale), side(100, scale), "#.", rng)
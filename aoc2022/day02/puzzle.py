@@ -2,25 +2,28 @@
 Day 02, https://adventofcode.com/2022/day/2
 
 Notes on Solutions:
-- Part 1: Most of the preparation happens in the `gamne_states` function which
-calculate the map of scores for each played move, along with the
-outcome of the game depending on all the possible states.
-Rock-Paper-Scissors is indeed a finite-state game, so we could bear enumating all the states.
-
-- Part 2: In this part, the only difference is in the fact that we need
-another map (i.e. dict) to associate plays that will end in the desired outcome
-(i.e. Draw, Win, Lose).
-Therefore, the `move` dictionary is calculated - via dictionary comprehension -
-and then used to calculate the score from the corresponding derived move.
+Rock-Paper-Scissors is indeed a finite-state game, so we could bear enumating all the states:
+there are only nine possible rounds (`ROUNDS`), and the score of each of them is calculated
+once (`SCORES`), for both the parts. Therefore, the strategy guide boils down to the number of
+times each round is played (see `tally`), and the total score to the sum of the products
+of those counts and the scores.
+Counts can also be calculated straight from the bytes of the guide, with one
+`bytes.count` per round (`tally_bytes`), reading (huge) files in chunks (`tally_file`).
+
+- Part 1: The second letter is the play, so the score is the value of the play, plus the outcome of the round.
+
+- Part 2: In this part, the only difference is in the fact that the second letter is
+the desired outcome (i.e. Lose, Draw, Win), so the play is derived from the play of the opponent
+(i.e. `0`, `1` or `2` steps ahead, modulo `3`).
 """
 
 __day__ = "02"
 __title__ = "Rock Paper Scissors"
 __author__ = "leriomaggio"
 
-from typing import Union
+from typing import Iterable, Union
 from pathlib import Path
-from itertools import islice, cycle
+from collections import Counter
 
 
 def load(filepath: Union[str, Path]) -> list[tuple[str, str]]:
@@ -32,39 +35,68 @@ LOSS = 0
 DRAW = 3
 WIN = 6
 
-# =========== Part 1 ============
+# All the nine possible rounds, in index order: 3 * opponent + own (i.e. `X`, `Y`, `Z`)
+ROUNDS = tuple(f"{opponent} {own}" for opponent in "ABC" for own in "XYZ")
+
+
+def outcome(opponent: int, own: int) -> int:
+    """Points of the outcome of a round (0: Rock, 1: Paper, 2: Scissors)"""
+    return (LOSS, DRAW, WIN)[(own - opponent + 1) % 3]
+
+
+# Score of each round, when own letter is the play (Part 1), or the outcome (Part 2)
+SCORES = tuple(
+    (
+        own + 1 + outcome(opponent, own),
+        (play := (opponent + own - 1) % 3) + 1 + outcome(opponent, play),
+    )
+    for opponent in range(3)
+    for own in range(3)
+)
+
+
+def tally(rounds: Iterable[tuple[str, str]]) -> list[int]:
+    """Histogram of the nine possible rounds"""
+    counts = Counter(map(" ".join, rounds))
+    return [counts[r] for r in ROUNDS]
 
 
-def game_states(plays: str) -> tuple[dict[tuple[str, str], int], dict[str, int]]:
-    """Calculates the score for each play (as specified by plays) along with the game states for all
-    combinations of Rock(A), Paper(B), Scissors(C) and plays."""
+def tally_bytes(guide: bytes) -> list[int]:
+    """Histogram of the nine possible rounds, straight from the bytes of the guide"""
+    return [guide.count(r.encode()) for r in ROUNDS]
 
-    points = {l: score for l, score in zip(plays, range(1, 4))}
-    states = {}
-    for i, score in enumerate((DRAW, WIN, LOSS)):
-        states.update(
-            {(e, p): score for e, p in zip("ABC", islice(cycle(plays), i, i + 3))}
-        )
-    return states, points
+
+def tally_file(filepath: Union[str, Path], chunk_size: int = 1 << 24) -> list[int]:
+    """Histogram of the nine possible rounds, reading the guide in chunks
+    (each one completed up to the end of its last line)"""
+    counts = [0] * len(ROUNDS)
+    with open(filepath, "rb") as guide:
+        while chunk := guide.read(chunk_size):
+            chunk += guide.readline()
+            counts = [c + n for c, n in zip(counts, tally_bytes(chunk))]
+    return counts
+
+
+def score(counts: list[int]) -> tuple[int, int]:
+    """Total score of the rounds (i.e. histogram), for both the parts"""
+    totals = ((n * s1, n * s2) for n, (s1, s2) in zip(counts, SCORES))
+    return tuple(map(sum, zip(*totals)))
+
+
+# =========== Part 1 ============
 
 
 def part1(data: list[tuple[str, str]]) -> int:
-    matchups, points = game_states(plays="XYZ")
-    return sum(matchups[(l1, l2)] + points[l2] for l1, l2 in data)
+    total, _ = score(tally(data))
+    return total
 
 
 # =========== Part 2 ============
 
 
-def part2(data: list[int]) -> int:
-    matchups, points = game_states(plays="ABC")
-    moves = {
-        move: {e: p for e, p in zip("ABC", islice(cycle("ABC"), i, i + 3))}
-        for i, move in enumerate(("Y", "Z", "X"))
-    }
-    return sum(
-        matchups[(l1, (move := moves[l2][l1]))] + points[move] for l1, l2 in data
-    )
+def part2(data: list[tuple[str, str]]) -> int:
+    _, total = score(tally(data))
+    return total
 
 
 if __name__ == "__main__":
@@ -72,8 +104,5 @@ if __name__ == "__main__":
     print(f"Day {__day__}: {__title__}")
     print("-" * 59)
     filepath = Path(__file__).with_name(f"input.{__day__}")
-    data = load(filepath=filepath)
-    # solve part 1
-    print(part1(data))
-    # solve part 2
-    print(part2(data))
+    # solve part 1 and 2 at once, straight from the bytes of the guide
+    print(*score(tally_file(filepath)), sep="\n")
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, score, tally_file
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -53,3 +53,20 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 10334, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestTally(AoCTest):
+    def test_tally_file_on_sample_data(self, tmp_path):
+        LOGGER.info(f"Part 1 and 2: Test Input (File)")
+        filepath = tmp_path / "input.02"
+        filepath.write_text(EXAMPLE_DATA)
+        assert score(tally_file(filepath, chunk_size=2)) == (15, 12)
+
+    def test_tally_file_on_game_input(self, game_input):
+        LOGGER.info(f"Part 1 and 2: Game Input (File)")
+        filepath = Path(__file__).with_name("input.02")
+        totals = score(tally_file(filepath, chunk_size=7))
+        assert totals == (part1(game_input), part2(game_input)), f"Tally File ❌"
@@ -2,54 +2,72 @@
 Day 03, https://adventofcode.com/2022/day/3
 
 Notes on Solutions:
-OK both solutions are very convoluted one-liners (no reason, only love to functionally 
-compose generator expressions)
-
-- Part 1: In part1 the inner-loop is taking care or calculating priorities
-gathered from intersection.
-
-- Part 2:Whereas in part2 the same nested loops generator expression is performed but with an
-additional step. Input are processed in triplets (three-lines a row, incrementally)
-which are then mapped to sets to calculate intersection (1 ^ (2 ^ 3))
+OK both solutions are (still) one-liners (no reason, only love to functionally 
+compose generator expressions). Items are never collected into sets: each compartment
+(or rucksack) is a `mask` of bits, one per item, where bit `p` is set for the item of priority `p`.
+The intersection is then a bitwise `&`, and the priority of the (only) item in common is
+just the position of its bit (i.e. `bit_length() - 1`).
+Rucksacks can be read from any iterable of lines (e.g. a file), one at a time.
+
+- Part 1: In part1 the masks of the two halves of each rucksack are intersected.
+
+- Part 2:Whereas in part2 rucksacks are processed in triplets (three-lines a row, incrementally),
+zipping the very same iterator three times (see `groups`), so no slice of the input is ever copied.
+Masks are then intersected (1 & 2 & 3).
 """
 
 __day__ = "03"
 __title__ = "Rucksack Reorganization"
 __author__ = "leriomaggio"
 
-from typing import Union
+from typing import Iterable, Iterator, Union
 from pathlib import Path
 from string import ascii_letters
+from functools import reduce
+from operator import or_
 
 
 def load(filepath: Union[str, Path]) -> list[str]:
     return list(open(filepath).read().split("\n"))
 
 
-PRIORITIES = {l: p for l, p in zip(ascii_letters, range(1, 58))}
+# Each item is a bit in a 53-bit mask, so that bit `p` is the item with priority `p`
+BITS = {l: 1 << p for l, p in zip(ascii_letters, range(1, 53))}
+
+
+def mask(items: str) -> int:
+    return reduce(or_, map(BITS.__getitem__, items), 0)
+
+
+def priority(common: int) -> int:
+    """Priority of the (only) item in common, if any"""
+    return common.bit_length() - 1 if common else 0
+
+
+def rucksacks(lines: Iterable[str]) -> Iterator[str]:
+    """Rucksacks, one at a time (e.g. lines from a file), skipping empty lines"""
+    return filter(None, map(str.strip, lines))
+
 
 # =========== Part 1 ============
-def part1(data: list[str]) -> int:
+def part1(data: Iterable[str]) -> int:
     return sum(
-        PRIORITIES[l]
-        for items in data
-        for l in set(items[: (len(items) // 2)]).intersection(
-            set(items[(len(items) // 2) :])
-        )
+        priority(mask(items[: (half := len(items) // 2)]) & mask(items[half:]))
+        for items in rucksacks(data)
     )
 
 
 # =========== Part 2 ============
 
 
-def part2(data: list[str]) -> int:
-    return sum(
-        PRIORITIES[l]
-        for e1, e2, e3 in map(
-            lambda t: map(set, t), zip(data[::3], data[1::3], data[2::3])
-        )
-        for l in e1.intersection(e2.intersection(e3))
-    )
+def groups(lines: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """Groups of three rucksacks, zipping the very same iterator three times"""
+    elves = rucksacks(lines)
+    return zip(elves, elves, elves)
+
+
+def part2(data: Iterable[str]) -> int:
+    return sum(priority(mask(e1) & mask(e2) & mask(e3)) for e1, e2, e3 in groups(data))
 
 
 if __name__ == "__main__":
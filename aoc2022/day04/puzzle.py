@@ -9,19 +9,25 @@ and `__le__` (for part 2)
 Therefore, part1 relies on the `in` Python operator, whereas part 2
 on <= (less then or equal).
 
-Interestingly, the `__iter__` method is also fundamental
-to allow for set conversion in other two magic methods.
+Both operators only compare the endpoints of the ranges (i.e. no section is ever
+enumerated), and so does `&`, i.e. the number of sections in common.
+For (very) many assignments, `parse` and `count` work on arrays of section IDs instead,
+without creating any `Range` at all.
 """
 
 __day__ = "04"
 __title__ = "Camp Cleanup"
 __author__ = "leriomaggio"
 
+import re
+from array import array
 from typing import Union
 from pathlib import Path
 
 
 class Range:
+    __slots__ = ("left", "right")
+
     def __init__(self, assignment: str) -> None:
         l, r = assignment.split("-")
         self.left, self.right = int(l.strip()), int(r.strip())
@@ -33,10 +39,14 @@ class Range:
         yield from range(self.left, self.right + 1)
 
     def __le__(self, other: "Range") -> bool:
-        return len(set(other).intersection(set(self))) > 0
+        return self.left <= other.right and other.left <= self.right
+
+    def __and__(self, other: "Range") -> int:
+        """Number of sections in common"""
+        return max(0, min(self.right, other.right) - max(self.left, other.left) + 1)
 
     def __len__(self):
-        return self.right - self.left
+        return self.right - self.left + 1
 
 
 def load(filepath: Union[str, Path]) -> list[tuple[str]]:
@@ -45,6 +55,24 @@ def load(filepath: Union[str, Path]) -> list[tuple[str]]:
     )
 
 
+def parse(text: Union[str, bytes]) -> tuple[array, array, array, array]:
+    """All the assignments at once, as four arrays (i.e. columns) of section IDs:
+    left and right of the first elf, left and right of the second elf"""
+    pattern = rb"\d+" if isinstance(text, bytes) else r"\d+"
+    ids = array("q", map(int, re.findall(pattern, text)))
+    return ids[0::4], ids[1::4], ids[2::4], ids[3::4]
+
+
+def count(l1: array, r1: array, l2: array, r2: array) -> tuple[int, int]:
+    """Number of pairs where one assignment contains the other, and where they overlap"""
+    contained = overlapping = 0
+    for a, b, c, d in zip(l1, r1, l2, r2):
+        if a <= d and c <= b:
+            overlapping += 1
+            contained += (a <= c and d <= b) or (c <= a and b <= d)
+    return contained, overlapping
+
+
 # =========== Part 1 ============
 
 
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, parse, count, Range
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -61,3 +61,27 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 888, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestBatch(AoCTest):
+    def test_count_on_sample_data(self):
+        LOGGER.info(f"Part 1 and 2: Test Input (Batch)")
+        assert count(*parse(EXAMPLE_DATA)) == (2, 4), f"Batch - Test Input ❌"
+
+    def test_count_on_bytes(self):
+        LOGGER.info(f"Part 1 and 2: Test Input (Batch, bytes)")
+        assert count(*parse(EXAMPLE_DATA.encode())) == (2, 4), f"Batch - Bytes ❌"
+
+    def test_count_on_game_input(self, game_input):
+        LOGGER.info(f"Part 1 and 2: Game Input (Batch)")
+        text = Path(__file__).with_name(f"input.{__day__}").read_bytes()
+        assert count(*parse(text)) == (part1(game_input), part2(game_input))
+
+    def test_intersection(self):
+        assert Range("2-4") & Range("6-8") == 0  # disjoint
+        assert Range("5-7") & Range("7-9") == 1  # touching
+        assert Range("2-8") & Range("3-7") == 5  # nested
+        assert Range("3-7") & Range("2-8") == len(Range("3-7"))
@@ -2,23 +2,25 @@
 Day 05, https://adventofcode.com/2022/day/5
 
 Notes on Solutions:
-Both solutions rely on the double-ended queues, and most of the
+Both solutions rely on plain lists as stacks (with the top crate at the end), and most of the
 heavylifting is performed in the `parse` function.
 
 The `parse` function is processing the input to return a
-dictionary of double-ended queues (indexed by the queue number),
+dictionary of stacks (indexed by the stack number),
 along with the list of instructions.
 
 The second generalisation between the two solutions has been
-achieved thanks to the `move` function which is moving
-items from one stack to another. The only difference is in the
-optional `key_fn` passed in. Identity function for part1,
-reversed function for part2.
-
-In other words, in part1, crates are added to the destination stack
-in the same order they're extracted from the first stack (i.e. FIFO),
-whilst part2 adds crates to the destination stack in reverse order from
-how they're popped from the source stack.
+achieved thanks to the `rearrange` function which is moving
+items from one stack to another, all at once: the top crates are sliced
+from the source stack (and deleted), and then extended to the destination.
+The only difference is in the `keep_order` flag:
+in part1, crates are moved one at a time, and so they are added to the destination stack
+in reverse order (i.e. LIFO), whilst part2 adds crates to the destination stack
+in the very same order they were on the source stack.
+
+Alternatively (i.e. `trace=True`), no crate is moved at all: the final position of
+the top crates is traced back (see `backtrace`), instruction by instruction, until
+the initial stacks are reached.
 """
 
 __day__ = "05"
@@ -27,8 +29,7 @@ __author__ = "leriomaggio"
 
 from typing import Union
 from pathlib import Path
-from collections import deque, defaultdict
-from typing import Callable, Iterable
+from collections import defaultdict
 
 
 def load(filepath: Union[str, Path]) -> list[str]:
@@ -37,8 +38,10 @@ def load(filepath: Union[str, Path]) -> list[str]:
 
 def parse(
     data: list[str],
-) -> tuple[defaultdict[int, deque], list[tuple[int, int, int]]]:
-    stacks = defaultdict(deque)
+) -> tuple[defaultdict[int, list], list[tuple[int, int, int]]]:
+    """Stacks of crates (i.e. lists, with the top crate at the end), along with
+    the list of instructions"""
+    stacks = defaultdict(list)
     instructions = list()
     get_instructions = False
 
@@ -57,32 +60,70 @@ def parse(
             }
             for index, item in crates.items():
                 stacks[index].append(item)
+    for stack in stacks.values():
+        stack.reverse()  # crates were read from the top
     return stacks, instructions
 
 
-def move(data: list[str], reverse: bool = False) -> str:
-    stacks, instructions = parse(data)
-    key_fn = reversed if reverse else lambda l: l
+def rearrange(
+    stacks: dict[int, list], instructions: list[tuple[int, int, int]], keep_order: bool
+) -> dict[int, list]:
+    """Apply all the instructions, moving all the crates of each instruction at once"""
+    for amount, from_id, to_id in instructions:
+        source = stacks[from_id]
+        crates = source[len(source) - amount :]
+        del source[len(source) - amount :]
+        stacks[to_id].extend(crates if keep_order else reversed(crates))
+    return stacks
+
+
+def backtrace(
+    stacks: dict[int, list], instructions: list[tuple[int, int, int]], keep_order: bool
+) -> dict[int, str]:
+    """Top crate of each (non empty) stack at the end, without moving any crate:
+    only the position of each top crate is traced back, from the last instruction
+    to the first one, as (stack, depth from the top of the stack)."""
+    heights = defaultdict(int, {s: len(stack) for s, stack in stacks.items()})
     for amount, from_id, to_id in instructions:
-        for crate in key_fn(
-            list(map(lambda _: stacks[from_id].popleft(), range(amount)))
-        ):
-            stacks[to_id].appendleft(crate)
-    return "".join([stacks[sk][0] for sk in sorted(stacks)])
+        heights[from_id] -= amount
+        heights[to_id] += amount
+    positions = {s: (s, 0) for s, height in heights.items() if height}
+    for amount, from_id, to_id in reversed(instructions):
+        for top, (s, depth) in positions.items():
+            if s == to_id and depth < amount:
+                # one of the crates moved: one at a time (i.e. reversed), or all at once
+                s, depth = from_id, depth if keep_order else amount - 1 - depth
+            elif from_id == to_id:
+                continue  # crates below the moved ones stay where they are
+            elif s == to_id:
+                depth -= amount
+            elif s == from_id:
+                depth += amount
+            positions[top] = s, depth
+    return {top: stacks[s][-1 - depth] for top, (s, depth) in positions.items()}
+
+
+def move(data: list[str], keep_order: bool = False, trace: bool = False) -> str:
+    stacks, instructions = parse(data)
+    if trace:
+        tops = backtrace(stacks, instructions, keep_order)
+        return "".join(tops[sk] for sk in sorted(tops))
+    stacks = rearrange(stacks, instructions, keep_order)
+    return "".join([stacks[sk][-1] for sk in sorted(stacks) if stacks[sk]])
 
 
 # =========== Part 1 ============
 
 
-def part1(data: list[str]) -> str:
-    return move(data=data)
+def part1(data: list[str], trace: bool = False) -> str:
+    return move(data=data, trace=trace)
 
 
 # =========== Part 2 ============
 
 
-def part2(data: list[int]) -> int:
-    return move(data=data, reverse=True)
+def part2(data: list[str], trace: bool = False) -> str:
+    return move(data=data, keep_order=True, trace=trace)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,16 @@ move 2 from 2 to 1
 move 1 from 1 to 2
 """
 
+EXAMPLE_DATA_EMPTY_STACK = """    [D]    
+[N] [C]    
+[Z] [M]    
+ 1   2   3 
+
+move 1 from 2 to 3
+move 2 from 1 to 1
+move 1 from 3 to 3
+"""
+
 LOGGER.warning(f"Test AoC22 Day {__day__}: {__title__}")
 
 
@@ -56,6 +66,17 @@ class TestPartTwo(AoCTest):
         LOGGER.info(f"Part 2: Test Input")
         assert part2(sample_input) == "MCD", f"Part 2 - Test Input ❌"
 
+    def test_backtrace_on_sample_data(self, sample_input):
+        LOGGER.info(f"Part 1 and 2: Test Input (Backtrace)")
+        assert part1(sample_input, trace=True) == "CMZ", f"Part 1 - Backtrace ❌"
+        assert part2(sample_input, trace=True) == "MCD", f"Part 2 - Backtrace ❌"
+
+    def test_backtrace_from_empty_stack(self):
+        LOGGER.info(f"Part 1 and 2: Empty Stack (Backtrace)")
+        data = EXAMPLE_DATA_EMPTY_STACK.splitlines()
+        assert part1(data, trace=True) == part1(data) == "ZCD"
+        assert part2(data, trace=True) == part2(data) == "NCD"
+
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == "FGLQJCMBD", f"Part 2 - Game Input ❌"
@@ -5,28 +5,69 @@ Notes on Solutions:
 Also in this case, the implementation of the two solutions is the very same
 apart from an input parameters that changes from `4` to `14` in part 2.
 
-The `parse` function is adding one character at a time and returns as soon
-as the first list of unique characters of target lenght has been found.
+The `scan` function reads the datastream one symbol (i.e. byte) at a time, and never
+stores any window: the window of distinct symbols ending at the current position starts
+right after the last time the current symbol has been seen (if that's within the window).
+Therefore, the last position of each symbol, along with the start of the window,
+is all it takes, and a marker of any length is found as soon as the window is long enough.
+Markers of many lengths are found in the very same pass, and the datastream can be
+read from a file in chunks, in constant memory.
 """
 
 __day__ = "06"
 __title__ = "Tuning Trouble"
 __author__ = "leriomaggio"
 
-from typing import Union
+from typing import Hashable, Iterable, Optional, Sequence, Union
 from pathlib import Path
+from array import array
 
 
 def load(filepath: Union[str, Path]) -> str:
     return open(filepath).read().strip()
 
 
-def parse(message: str, length: int) -> int:
-    received = list(message[: (st := length - 1)])
-    for character in message[st:]:
-        received.append(character)
-        if len(set(received[-length:])) == length:
-            return len(received)
+def chunks(filepath: Union[str, Path], size: int = 1 << 20) -> Iterable[bytes]:
+    """Datastream read from file in chunks of (at most) size bytes"""
+    with open(filepath, "rb") as stream:
+        while chunk := stream.read(size):
+            yield chunk
+
+
+def scan(
+    stream: Iterable[Sequence[int]], lengths: Iterable[int], alphabet: int = 256
+) -> dict[int, Optional[int]]:
+    """Position of the first marker (i.e. the first window of distinct symbols)
+    for each of the lengths, in a single pass over the stream (e.g. chunks of bytes).
+    The window of distinct symbols ending on the current position starts right after
+    the last occurrence of the current symbol (if within the window), so the only
+    state is a table of the last position of each symbol (i.e. byte), and the start."""
+    pending = sorted(set(lengths))
+    markers = dict.fromkeys(pending)
+    last_seen = [-1] * alphabet
+    start = offset = 0
+    for chunk in stream:
+        for position, symbol in enumerate(memoryview(chunk), start=offset):
+            if last_seen[symbol] >= start:
+                start = last_seen[symbol] + 1
+            last_seen[symbol] = position
+            while pending and position - start + 1 >= pending[0]:
+                markers[pending.pop(0)] = position + 1
+            if not pending:
+                return markers
+        offset += len(chunk)
+    return markers
+
+
+def parse(message: Union[str, bytes, Sequence[Hashable]], length: int) -> Optional[int]:
+    if isinstance(message, str):
+        message = message.encode()
+    if isinstance(message, (bytes, bytearray)):
+        return scan([message], [length])[length]
+    # any other sequence of symbols, mapped to (small) integers first
+    symbols = dict()
+    ids = array("L", (symbols.setdefault(s, len(symbols)) for s in message))
+    return scan([ids], [length], alphabet=len(symbols))[length]
 
 
 # =========== Part 1 ============
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, chunks, scan
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -59,3 +59,26 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 3513, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestScan(AoCTest):
+    def test_scan_chunks_on_sample_data(self, sample_input, tmp_path):
+        LOGGER.info(f"Part 1 and 2: Test Input (Chunks)")
+        filepath = tmp_path / f"input.{__day__}"
+        for sample in sample_input:
+            s_input, result1, result2 = sample.split("-")
+            filepath.write_text(s_input)
+            markers = scan(chunks(filepath, size=5), [4, 14])
+            assert markers == {
+                4: int(result1),
+                14: int(result2),
+            }, f"Scan - Test Input ❌"
+
+    def test_scan_chunks_on_game_input(self, game_input):
+        LOGGER.info(f"Part 1 and 2: Game Input (Chunks)")
+        filepath = Path(__file__).with_name(f"input.{__day__}")
+        markers = scan(chunks(filepath, size=5), [4, 14])
+        assert markers == {4: part1(game_input), 14: part2(game_input)}
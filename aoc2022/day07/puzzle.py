@@ -2,17 +2,18 @@
 Day 07, https://adventofcode.com/2022/day/7
 
 Notes on Solutions:
-For this puzzle I had lots of fun abusing with the Python Data Model.
-
-I implemented my custom (implicitly recursive) File Tree
-data structure which is capable of `+=` adding new entries, as well
-as being an iterable (i.e. `__iter__`) and subscriptable (i.e. `__getitem__`)
-object. The `size` of each node is calculated recursively, and then stored as the
-folder structure is not going to change throughout the whole game.
-
-Also, being the `Entry` object iterable, functions like `filter` could also be
-used to filter directories or nodes satisfying other conditions (as those used to
-solve part 1 and part2)
+The file system is not a tree of objects, but a flat table of _inodes_ (see `FileSystem`):
+the parent, size, and type (i.e. directory or not) of each entry are stored in compact arrays,
+whereas entries of each directory are looked up in a dictionary by `(parent, name)`.
+Inodes are numbered in order of discovery, therefore the parent of each entry
+comes always before it: visiting the table backwards, the total size of each entry
+is added to its parent, and all directory sizes are calculated in a single pass (no recursion).
+Total sizes are kept apart from the sizes of the files, so they can be aggregated again
+(e.g. after adding more entries).
+
+Directory sizes are then sorted once, so that the queries of part 1 (i.e. total size
+of directories up to a threshold, with prefix sums) and part 2 (i.e. the smallest
+directory above a threshold) are both a binary search.
 """
 
 __day__ = "07"
@@ -21,88 +22,93 @@ __author__ = "leriomaggio"
 
 from typing import Union
 from pathlib import Path
-
-
-class Entry:
-    def __init__(self, label: str, fsize: int = 0):
-        self._nodes = list()
-        self._label = label
-        self._size = fsize
-        self._parent = None
-
-    def __iadd__(self, entry: "Entry") -> None:
-        entry.parent = self
-        self._nodes.append(entry)
-        return self
-
-    @property
-    def is_directory(self) -> bool:
-        return self._label.startswith("dir")
-
-    @property
-    def parent(self):
-        return self._parent
-
-    @parent.setter
-    def parent(self, p: "Entry"):
-        self._parent = p
-
-    @property
-    def name(self) -> str:
-        return self._label.replace("dir:", "")
-
-    @property
-    def size(self) -> int:
-        if not self._size:
-            self._size = sum(n.size for n in self._nodes)
-        return self._size
-
-    def __iter__(self):
-        for subtree in self._nodes:
-            yield from subtree
-        yield self
-
-    def __getitem__(self, label):
-        for n in self._nodes:
-            if n.name == label:
-                return n
-        return None
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+ROOT = 0  # i.e. the inode of `/`
+
+
+class FileSystem:
+    """Flat table of inodes (i.e. parent, size, and whether it is a directory),
+    with entries of each directory looked up by `(parent, name)`.
+    Inodes are numbered in order of discovery, so children always follow their parent."""
+
+    def __init__(self) -> None:
+        self.parent = array("q", [ROOT])
+        self.size = array("q", [0])  # of files only
+        self.is_dir = bytearray([1])
+        self.total: array = None  # i.e. aggregated sizes
+        self.entries: dict[tuple[int, str], int] = dict()
+        self._dir_sizes: list[int] = None
+        self._prefix: list[int] = None
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __getitem__(self, entry: tuple[int, str]) -> int:
+        return self.entries[entry]
+
+    def add(self, parent: int, name: str, size: int = 0, is_dir: bool = False) -> int:
+        if (inode := self.entries.get((parent, name))) is None:
+            inode = self.entries[parent, name] = len(self)
+            self.parent.append(parent)
+            self.size.append(size)
+            self.is_dir.append(is_dir)
+        return inode
+
+    def aggregate(self) -> None:
+        """Total sizes of all the entries, in a single (post-order) pass: visiting inodes
+        backwards, all the children of a directory are summed up before it is."""
+        self.total = array("q", self.size)
+        for inode in range(len(self) - 1, ROOT, -1):
+            self.total[self.parent[inode]] += self.total[inode]
+        self._dir_sizes = sorted(s for s, d in zip(self.total, self.is_dir) if d)
+        self._prefix = list(accumulate(self._dir_sizes, initial=0))
+
+    def total_at_most(self, threshold: int) -> int:
+        """Sum of the sizes of all the directories of size at most threshold"""
+        return self._prefix[bisect_right(self._dir_sizes, threshold)]
+
+    def smallest_at_least(self, threshold: int) -> int:
+        """Size of the smallest directory of size at least threshold"""
+        return self._dir_sizes[bisect_left(self._dir_sizes, threshold)]
 
 
 def load(filepath: Union[str, Path]):
     return list(map(lambda l: l.strip(), open(filepath).read().split("\n")))
 
 
-def parse(history_log: list[str]) -> Entry:
-    root = Entry(label="/")
-    curdir = root
+def parse(history_log: list[str]) -> FileSystem:
+    fs = FileSystem()
+    curdir = ROOT
     for line in history_log[1:]:
-        if line.startswith("$ ls"):
+        if not line or line.startswith("$ ls"):
             continue
         if line.startswith("$ cd"):
             _, _, label = line.split()
             if label == "..":
-                curdir = curdir.parent
+                curdir = fs.parent[curdir]
+            elif label == "/":
+                curdir = ROOT
             else:
-                curdir = curdir[label]
+                curdir = fs.add(curdir, label, is_dir=True)
             continue
         if line.startswith("dir"):
             _, label = line.split()
-            curdir += Entry(label=f"dir:{label}")
+            fs.add(curdir, label, is_dir=True)
         else:
             fsize, label = line.split()
-            curdir += Entry(label=label, fsize=int(fsize))
-    return root
+            fs.add(curdir, label, size=int(fsize))
+    fs.aggregate()
+    return fs
 
 
 # =========== Part 1 ============
 
 
 def part1(data: list[str]) -> int:
-    root_dir = parse(data)
-    return sum(
-        entry.size for entry in root_dir if entry.is_directory and entry.size <= 100000
-    )
+    return parse(data).total_at_most(100000)
 
 
 # =========== Part 2 ============
@@ -112,11 +118,9 @@ MIN_REQUIRED = 30000000
 
 
 def part2(data: list[str]) -> int:
-    root_dir = parse(data)
-    to_free = MIN_REQUIRED - (TOTAL_DISK_SPACE - root_dir.size)
-    return min(
-        n.size for n in filter(lambda n: n.is_directory and n.size >= to_free, root_dir)
-    )
+    fs = parse(data)
+    to_free = MIN_REQUIRED - (TOTAL_DISK_SPACE - fs.total[ROOT])
+    return fs.smallest_at_least(to_free)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, parse, ROOT
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -73,3 +73,18 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 1815525, f"Part 2 - Game Input ❌"
+
+
+# ----- Both Parts -----
+
+
+class TestFileSystem(AoCTest):
+    def test_aggregate_twice(self, sample_input):
+        LOGGER.info(f"Part 1 and 2: Test Input (Aggregate)")
+        fs = parse(sample_input)
+        fs.aggregate()
+        assert fs.total[ROOT] == 48381165, f"Aggregate - Test Input ❌"
+        assert fs.total_at_most(100000) == 95437, f"Aggregate - Test Input ❌"
+        fs.add(fs[ROOT, "d"], "k.log", size=1000)
+        fs.aggregate()
+        assert fs.total[ROOT] == 48382165, f"Aggregate - New File ❌"
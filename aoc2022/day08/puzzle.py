@@ -2,89 +2,95 @@
 Day 08, https://adventofcode.com/2022/day/8
 
 Notes on Solutions:
-The core of the two solutions is the `explore` function which generates the
-neightbourhood and all the found shorter_tree, given a pair of coordinates.
-
-Since it's all based on generators and lazy-sequence, we use `itertools.tee`
-to generate two independent iterators on the neighbourhood. One to be returned,
-the second one to be filtered looking for shorter_trees
-(using `itertools.takewhile`).
-
-- Part 1: Leveraging `explore`, part1 will simply sum how many times, for all
-the possible nodes (i.e. coords), all trees in the neighbourhood are shorter
-(and so it is visible)
-
-- Part 2: In a very similar fashion, in part 2 we calculate the product of all
-the shortest tree + 1 (i.e. the fringe) if the number of shorter_trees is not the
-whole neighbourhood. The reason for this, is because the text of the puzzle
-considers also trees with the **same** height, whereas the filter in `explore`
-(i.e. `takewhile`) only consider shorter trees.
+The core of the two solutions is the `survey` function, which sweeps each row and
+each column of the forest once per direction (i.e. four sweeps), rather than walking
+from each tree towards the edges. The forest is stored in the shared `Grid` (see `grid.py`),
+so each sweep is just a `range` of flat indices (see `lines`).
+Along each sweep:
+- a tree is visible (from the edge the sweep starts from) if taller than all the trees before it,
+i.e. their running maximum;
+- the trees before it which could still block the view of the next trees are kept
+in a _monotonic stack_: shorter trees are popped (as the current one hides them),
+so the top of the stack is the closest tree at least as tall, where the view stops.
+
+Therefore, visibility and scenic scores of all the trees are calculated in linear time
+(in the number of trees).
+
+- Part 1: part1 will simply count how many trees are visible from at least one edge.
+
+- Part 2: In a very similar fashion, in part 2 the scenic score is the product of the
+viewing distances of each sweep. Note that the text of the puzzle considers also trees
+with the **same** height in view (that's why they stop the view, and are popped only
+by taller trees).
 """
 
 __day__ = "08"
 __title__ = "Treetop Tree House"
 __author__ = "leriomaggio"
 
-from typing import Union
+import sys
+from typing import Iterator, Union
 from pathlib import Path
-from typing import Generator, Iterable
-from itertools import takewhile, product, tee
-from math import prod
+from array import array
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # shared modules
+from grid import Grid
 
 
 def load(filepath: Union[str, Path]) -> list[list[int]]:
-    return [[int(t) for t in line] for line in open(filepath).read().split("\n")]
+    lines = open(filepath).read().strip().splitlines()
+    return [[int(t) for t in line.strip()] for line in lines if line.strip()]
+
+
+def lines(forest: Grid) -> Iterator[range]:
+    """Flat indices of trees along each row and column, in both directions"""
+    w, last_row, last_col = forest.width, forest.nrows - 1, forest.ncols - 1
+    for r in range(forest.nrows):
+        first, last = forest.index(r, 0), forest.index(r, last_col)
+        yield range(first, last + 1)
+        yield range(last, first - 1, -1)
+    for c in range(forest.ncols):
+        first, last = forest.index(0, c), forest.index(last_row, c)
+        yield range(first, last + 1, w)
+        yield range(last, first - 1, -w)
+
+
+def survey(forest: Grid) -> tuple[bytearray, array]:
+    """Visibility and scenic score of all the trees (aligned with the cells of forest),
+    sweeping each line once: trees are visible if taller than the running maximum,
+    and the viewing distance looking back is up to the closest tree at least as tall,
+    i.e. the top of a monotonic stack of trees (decreasing in height)."""
+    trees = forest.cells
+    visible, score = bytearray(len(trees)), array("q", [1]) * len(trees)
+    for line in lines(forest):
+        tallest, stack = -1, list()  # positions (along line) of trees
+        for k, tree in enumerate(line):
+            height = trees[tree]
+            if height > tallest:
+                visible[tree], tallest = 1, height
+            while stack and trees[line[stack[-1]]] < height:
+                stack.pop()
+            score[tree] *= k - stack[-1] if stack else k  # i.e. up to the edge
+            stack.append(k)
+    return visible, score
 
 
 # =========== Part 1 ============
 
 
-def explore(
-    trees: list[list[int]], row: int, col: int
-) -> Generator[tuple[Iterable[int], Iterable[int]], None, None]:
-    n_rows, n_cols = len(trees), len(trees[0])
-    directions = product(
-        zip(("row", "col"), (row, col), (n_rows, n_cols)), (True, False)
-    )
-    for (axis, dim, limit), reverse in directions:
-        coords = reversed(range(0, dim)) if reverse else range(dim + 1, limit)
-        neighbours_1, neighbours_2 = tee(
-            map(lambda c: (row, c) if axis == "col" else (c, col), coords)
-        )
-        shorter_trees = takewhile(
-            lambda c: trees[c[0]][c[1]] < trees[row][col], neighbours_2
-        )
-        yield neighbours_1, shorter_trees
-
-
-def is_visible(trees: list[list[int]], row: int, col: int) -> bool:
-    return any(
-        len(list(neighbours)) == len(list(shorter_trees))
-        for neighbours, shorter_trees in explore(trees, row, col)
-    )
-
-
 def part1(data: list[list[int]]) -> int:
-    return sum(
-        is_visible(data, i, j) for i, row in enumerate(data) for j, _ in enumerate(row)
-    )
+    forest = Grid.from_rows(data)
+    visible, _ = survey(forest)
+    return sum(visible[tree] for tree in forest)
 
 
 # =========== Part 2 ============
 
 
-def scenic_cone(trees, row: int, col: int) -> int:
-    return prod(
-        len(st := list(shorter_trees))
-        + (fringe := 1 if len(st) < len(list(neighbours)) else 0)
-        for neighbours, shorter_trees in explore(trees, row, col)
-    )
-
-
-def part2(data: list[int]) -> int:
-    return max(
-        scenic_cone(data, i, j) for i, row in enumerate(data) for j, _ in enumerate(row)
-    )
+def part2(data: list[list[int]]) -> int:
+    forest = Grid.from_rows(data)
+    _, score = survey(forest)
+    return max(score[tree] for tree in forest)
 
 
 if __name__ == "__main__":
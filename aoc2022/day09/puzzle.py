@@ -3,25 +3,22 @@ Day 09, https://adventofcode.com/2022/day/9
 
 Notes on Solutions:
 With this puzzle, I hadn't still discovered the trick of using complex numbers (
-see solution to puzzle 14), therefore I am sticking with coordinates as tuples.
-Therefore, the first thing I need is a function to move the knots.
-This is `move` which simply implements the element-wise sum of tuples.
-
-Large caveat with my implementation: it is going to be very reliant on itertools
-and functional-style programming (intentionally, ed.)
-
-Similarly, `distance` and `neighbourhood` calculate the distance between head (H) and
-tail (T), and the neighbourhood of a pair of a generic pair of 2D coordinates, respectively.
-
-The `direction` function is an extension of the latter adding labels to each direction
-in the neighbourhood of given coordinates. This function will be leveraged to
-call the respective pre-assembled `partial(move)` function, towards the corresponding
-direction (according to instructions).
-
-To check if T is adjacent to H, we simply check it belongs to H's neighbourhood.
-
-Finally, we simulate the moves of H, and T inductively on each H-T pair with
-`knots=2` in part1, and `knots=10` in part2.
+see solution to puzzle 14), and anyway no tuple (nor complex) is really needed here.
+Knots are kept in two flat lists of integers, `xs` and `ys`, i.e. the coordinates
+of each knot, with the head in position 0, and updated in place.
+
+A knot has to move only if it is not touching the previous one, i.e. if the
+difference in either of the coordinates is larger than one. In that case, the knot
+moves (at most) one step towards the previous knot along each axis, which is just
+the _sign_ of the differences (`(d > 0) - (d < 0)`). No need for any neighbourhood!
+
+Moreover, as soon as a knot does not move, none of the following will either:
+the rest of the rope is left untouched, and the simulation moves on to the next step
+of the head. Similarly, the tail only needs to be marked as visited when it does move.
+Visited positions are packed into a single integer (see `pack`), rather than tuples.
+
+Part 1 and Part 2 simply simulate the rope with `n_knots=2`, and `n_knots=10`,
+respectively (any number of knots works, though).
 """
 
 __day__ = "09"
@@ -30,10 +27,9 @@ __author__ = "leriomaggio"
 
 from typing import Union
 from pathlib import Path
-from functools import partial
-from itertools import product
-from typing import Iterable
-from math import copysign
+
+MOVES = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
+STRIDE = 1 << 32  # ample room for (signed) coordinates
 
 
 def load(filepath: Union[str, Path]) -> list[tuple[str, int]]:
@@ -48,54 +44,27 @@ def load(filepath: Union[str, Path]) -> list[tuple[str, int]]:
 # =========== Part 1 ============
 
 
-def move(position: tuple[int], direction: tuple[int]):
-    return tuple(map(sum, zip(position, direction)))
-
-
-def distance(H, T):
-    return tuple([(h - t) // max(1, abs(h - t)) for h, t in zip(H, T)])
-
-
-def neighbourhood(coord: tuple[int, int]) -> Iterable[tuple[int, int]]:
-    return map(lambda d: move(coord, d), tuple(product((-1, 0, 1), repeat=2)))
-
-
-def directions(coord: tuple[int, int]) -> dict[str, tuple[int, int]]:
-    return {
-        label: direction
-        for label, direction in zip(
-            map(
-                lambda dd: "P" if not "".join(dd) else "".join(dd),
-                product(("D", "", "U"), ("L", "", "R")),
-            ),
-            neighbourhood(coord),
-        )
-    }
-
-
-def adjacent(H, T) -> bool:
-    return T in set(neighbourhood(H))
+def pack(x: int, y: int) -> int:
+    return x * STRIDE + y
 
 
 def simulate(instructions: list[tuple[str, int]], n_knots: int = 2) -> int:
-    S = (0, 0)
-    move_towards = {
-        lbl: partial(move, direction=direction)
-        for lbl, direction in directions(S).items()
-    }
-    direction_map = {direction: lbl for lbl, direction in directions(S).items()}
-    knots = {i: S for i in range(n_knots)}
-    t_marks = {S}
+    xs, ys = [0] * n_knots, [0] * n_knots
+    t_marks = {pack(0, 0)}
     for direction, steps in instructions:
+        dx, dy = MOVES[direction]
         for _ in range(steps):
-            knots[0] = move_towards[direction](knots[0])
-            if adjacent(knots[0], knots[1]):
-                continue
-            for h, t in zip(range(n_knots), range(1, n_knots)):
-                if not adjacent(knots[h], knots[t]):
-                    dir_label = direction_map[distance(H=knots[h], T=knots[t])]
-                    knots[t] = move_towards[dir_label](knots[t])
-            t_marks.add(knots[n_knots - 1])
+            x, y = xs[0] + dx, ys[0] + dy
+            xs[0], ys[0] = x, y
+            for k in range(1, n_knots):
+                ddx, ddy = x - xs[k], y - ys[k]
+                if -1 <= ddx <= 1 and -1 <= ddy <= 1:
+                    break  # still touching: rest of the rope stays put
+                x = xs[k] + (ddx > 0) - (ddx < 0)
+                y = ys[k] + (ddy > 0) - (ddy < 0)
+                xs[k], ys[k] = x, y
+            else:  # the tail moved (to x, y)
+                t_marks.add(pack(x, y))
     return len(t_marks)
 
 
@@ -106,7 +75,7 @@ def part1(data: list[tuple[str, int]]) -> int:
 # =========== Part 2 ============
 
 
-def part2(data: list[int]) -> int:
+def part2(data: list[tuple[str, int]]) -> int:
     return simulate(instructions=data, n_knots=10)
 
 
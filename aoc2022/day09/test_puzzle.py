@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from pytest import fixture, mark
 
-from puzzle import load, part1, part2
+from puzzle import load, part1, part2, simulate
 from puzzle import __day__, __title__
 
 LOGGER = logging.getLogger(__name__)
@@ -83,3 +83,7 @@ class TestPartTwo(AoCTest):
     def test_part2_on_game_input(self, game_input):
         LOGGER.info(f"Part 2: Game Input")
         assert part2(game_input) == 2460, f"Part 2 - Game Input ❌"
+
+    def test_long_rope_on_sample_data(self, sample_input_part_2):
+        LOGGER.info(f"Part 2: Long Rope")
+        assert simulate(sample_input_part_2, n_knots=1000) == 1  # tail never moves
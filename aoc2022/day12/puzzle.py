@@ -6,6 +6,9 @@ The core of the solutions for the two parts lies in the `traverse` function,
 which simply implements a BFS visit on a graph, with a twist.
 The twist is the added bounding criterion on the search, which consider the heights
 of the vertices during the traversal.
+The heightmap is stored in the shared `Grid` (see `grid.py`): positions are flat
+indices, neighbours are found by offset, and `visited` is a `bytearray` aligned
+with the cells, rather than a `set` of coordinates.
 
 - Part 1: Simple implementation of the BFS from Source to Target (modified so that S ="a" and E = "z")
 - Part 2: BFS traverse in reverse mode: therefore, we start from E (destination in part 1) and we bound the search
@@ -16,72 +19,61 @@ __day__ = "12"
 __title__ = "Hill Climbing Algorithm"
 __author__ = "leriomaggio"
 
+import sys
 from typing import Union
 from pathlib import Path
 from collections import deque
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # shared modules
+from grid import Grid
+
 
 def load(filepath: Union[str, Path]):
     return parse_input(open(filepath).read())
 
 
-def parse_input(data: str) -> list[list[str]]:
-    grid = [list(l) for l in data.strip().split("\n")]
-    for r, row in enumerate(grid):
-        for c, item in enumerate(row):
-            if item == "S":
-                s_coords = (r, c)
-            if item == "E":
-                e_coords = (r, c)
-            grid[r][c] = (
-                ord("a") if item == "S" else ord("z") if item == "E" else ord(item)
-            )
-    return grid, s_coords, e_coords
-
-
-def is_within(coord: tuple[int, int], boundaries: tuple[int, int]) -> bool:
-    return all(map(lambda p: 0 <= p[0] < p[1], zip(coord, boundaries)))
-
-
-def traverse(
-    maze: list[list[int]], S: tuple[int, int], E: tuple[int, int], reverse: bool = False
-):
-    fringe = deque()
-    (sr, sc, er, ec) = (*S, *E) if not reverse else (*E, *S)
-    stop_traverse = lambda a, b: (a - b) > 1
-    bounding = lambda a, b: stop_traverse(a, b) if not reverse else stop_traverse(b, a)
-    destination = (
-        lambda nr, nc: maze[nr][nc] == maze[er][ec] if reverse else (nr, nc) == (er, ec)
-    )
-
-    W, H = len(maze[0]), len(maze)
-    fringe.append((0, sr, sc))
-    visited = {(sr, sc)}
+def parse_input(data: str) -> tuple[Grid, int, int]:
+    rows = data.strip().split("\n")
+    heights = [
+        [ord(h) for h in row.replace("S", "a").replace("E", "z")] for row in rows
+    ]
+    maze = Grid.from_rows(heights)
+    text = "".join(rows)
+    S, E = (maze.index(*divmod(text.index(m), maze.ncols)) for m in "SE")
+    return maze, S, E
+
+
+def traverse(maze: Grid, S: int, E: int, reverse: bool = False):
+    heights, border = maze.cells, maze.border
+    source, target = (S, E) if not reverse else (E, S)
+    visited = bytearray(len(heights))
+    visited[source] = 1
+    fringe = deque([(0, source)])
     while fringe:
-        d, r, c = fringe.popleft()
-        for nr, nc in filter(
-            lambda cc: is_within(cc, (H, W)) and cc not in visited,
-            [(r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)],
-        ):
-            if bounding(maze[nr][nc], maze[r][c]):
+        d, cell = fringe.popleft()
+        for n in (cell + offset for offset in maze.offsets4):
+            if visited[n] or heights[n] == border:
+                continue
+            climb = heights[n] - heights[cell]
+            if (climb if not reverse else -climb) > 1:
                 continue
-            if destination(nr, nc):
+            if n == target or (reverse and heights[n] == heights[target]):
                 return d + 1
-            visited.add((nr, nc))
-            fringe.append((d + 1, nr, nc))
+            visited[n] = 1
+            fringe.append((d + 1, n))
 
 
 # =========== Part 1 ============
 
 
-def part1(data: tuple[list, tuple, tuple]) -> int:
+def part1(data: tuple[Grid, int, int]) -> int:
     return traverse(*data)
 
 
 # # =========== Part 2 ============
 
 
-def part2(data: tuple[list, tuple, tuple]) -> int:
+def part2(data: tuple[Grid, int, int]) -> int:
     return traverse(*data, reverse=True)
 
 
@@ -0,0 +1,359 @@
+""" -- Advent of Code 2022 --
+Synthetic input generators, used by the benchmark suite (see `benchmark.py`).
+
+Each `dayNN(scale, rng)` function returns the text of a puzzle input
+which is (roughly) `scale` times the size of the original `input.NN`,
+in exactly the same format.
+Grids grow in both dimensions, i.e. each side is scaled by `sqrt(scale)`
+(or `cbrt(scale)` for the lava droplet of Day 18).
+
+`PARTS` lists the parts worth benchmarking on synthetic data, for those puzzles
+whose answer is not guaranteed to exist (or to depend on size) on random input.
+"""
+
+from math import sqrt
+from random import Random
+from string import ascii_letters, ascii_lowercase, ascii_uppercase
+
+PARTS = {"19": (1,)}  # part 2 only considers the first three blueprints
+
+
+def side(base: int, scale: float) -> int:
+    return max(1, round(base * sqrt(scale)))
+
+
+def grid(nrows: int, ncols: int, alphabet: str, rng: Random) -> str:
+    return "\n".join("".join(rng.choices(alphabet, k=ncols)) for _ in range(nrows))
+
+
+def names(n: int, rng: Random, length: int = 4, reserved: tuple = ()) -> list[str]:
+    labels = set(reserved)
+    while len(labels) < n + len(reserved):
+        labels.add("".join(rng.choices(ascii_lowercase, k=length)))
+    return rng.sample(sorted(labels - set(reserved)), k=n)
+
+
+def day01(scale: float, rng: Random) -> str:
+    groups = list()
+    for _ in range(round(250 * scale)):
+        groups.append(
+            "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        )
+    return "\n\n".join(groups)
+
+
+def day02(scale: float, rng: Random) -> str:
+    return "\n".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(round(2500 * scale))
+    )
+
+
+def day03(scale: float, rng: Random) -> str:
+    rucksacks = list()
+    for _ in range(round(100 * scale)):
+        badge, *items = rng.sample(ascii_letters, k=4)
+        others = [c for c in ascii_letters if c != badge and c not in items]
+        rng.shuffle(others)
+        for e, item in enumerate(items):
+            pool = others[e * 16 : (e + 1) * 16]
+            left = rng.choices(pool[:8], k=rng.randint(4, 15)) + [item]
+            right = rng.choices(pool[8:], k=len(left) - 2) + [item, badge]
+            rng.shuffle(left), rng.shuffle(right)
+            rucksacks.append("".join(left + right))
+    return "\n".join(rucksacks)
+
+
+def day04(scale: float, rng: Random) -> str:
+    def section() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{section()},{section()}" for _ in range(round(1000 * scale)))
+
+
+def day05(scale: float, rng: Random) -> str:
+    height = side(8, scale)
+    stacks = [
+        rng.choices(ascii_uppercase, k=rng.randint(2, max(2, height))) for _ in range(9)
+    ]
+    drawing = [
+        " ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks)
+        for level in reversed(range(max(map(len, stacks))))
+    ]
+    drawing.append(" ".join(f" {i + 1} " for i in range(9)))
+    sizes, moves = list(map(len, stacks)), list()
+    for _ in range(round(500 * scale)):
+        # never empty a stack, as the top crate of each stack is the answer
+        source = rng.choice([i for i, size in enumerate(sizes) if size > 1])
+        target = rng.choice([i for i in range(9) if i != source])
+        amount = rng.randint(1, sizes[source] - 1)
+        sizes[source] -= amount
+        sizes[target] += amount
+        moves.append(f"move {amount} from {source + 1} to {target + 1}")
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+def day06(scale: float, rng: Random) -> str:
+    # three letters only, so that the markers are at the very end of the stream
+    noise = "".join(rng.choices("abc", k=round(4096 * scale) - 14))
+    return noise + "".join(rng.sample(ascii_lowercase[3:], k=14))
+
+
+def day07(scale: float, rng: Random) -> str:
+    n_entries = round(600 * scale)
+    folders = {"/": ([], [])}  # path -> (files, subfolders)
+    paths = ["/"]
+    for label in names(n_entries, rng, length=6):
+        parent = paths[-rng.randint(1, min(10, len(paths)))]
+        if rng.random() < 0.3 and parent.count("/") < 12:
+            path = f"{parent}{label}/"
+            folders[parent][1].append(label)
+            folders[path] = ([], [])
+            paths.append(path)
+        else:
+            # keep total disk usage in the same ballpark, so that part 2 has a solution
+            folders[parent][0].append(
+                (max(1, round(rng.randint(1000, 300000) / scale)), label)
+            )
+
+    def ls(path: str):
+        files, subfolders = folders[path]
+        yield "$ ls"
+        entries = [f"dir {d}" for d in subfolders] + [f"{s} {f}" for s, f in files]
+        yield from rng.sample(entries, k=len(entries))
+        for d in subfolders:
+            yield f"$ cd {d}"
+            yield from ls(f"{path}{d}/")
+            yield "$ cd .."
+
+    return "\n".join(["$ cd /", *ls("/")])
+
+
+def day08(scale: float, rng: Random) -> str:
+    return grid(side(99, scale), side(99, scale), "0123456789", rng)
+
+
+def day09(scale: float, rng: Random) -> str:
+    return "\n".join(
+        f"{rng.choice('RLUD')} {rng.randint(1, 20)}" for _ in range(round(2000 * scale))
+    )
+
+
+def day10(scale: float, rng: Random) -> str:
+    sprite, instructions = 1, list()
+    for _ in range(round(140 * scale)):
+        if rng.random() < 0.3:
+            instructions.append("noop")
+            continue
+        value = rng.randint(-10, 10) + (1 if sprite < 20 else -1)
+        sprite += value
+        instructions.append(f"addx {value}")
+    return "\n".join(instructions)
+
+
+MONKEY_CARD = """Monkey {mid}:
+  Starting items: {items}
+  Operation: new = {operation}
+  Test: divisible by {divisor}
+    If true: throw to monkey {if_true}
+    If false: throw to monkey {if_false}"""
+
+
+def day11(scale: float, rng: Random) -> str:
+    divisors = rng.sample((2, 3, 5, 7, 11, 13, 17, 19), k=8)
+    operations = ["old * old", f"old * {rng.randint(2, 19)}"]
+    operations += [f"old + {rng.randint(1, 8)}" for _ in range(6)]
+    rng.shuffle(operations)
+    monkeys = list()
+    for mid in range(8):
+        if_true, if_false = rng.sample([m for m in range(8) if m != mid], k=2)
+        items = [
+            rng.randint(50, 99) for _ in range(max(1, round(rng.randint(1, 8) * scale)))
+        ]
+        monkeys.append(
+            MONKEY_CARD.format(
+                mid=mid,
+                items=", ".join(map(str, items)),
+                operation=operations[mid],
+                divisor=divisors[mid],
+                if_true=if_true,
+                if_false=if_false,
+            )
+        )
+    return "\n\n".join(monkeys)
+
+
+def day12(scale: float, rng: Random) -> str:
+    nrows, ncols = side(41, scale), max(26, side(161, scale))
+    start_row = nrows // 2
+    heightmap = list()
+    for r in range(nrows):
+        row = list()
+        for c in range(ncols):
+            height = c * 26 // ncols  # climbing by at most one, moving east
+            if r != start_row and rng.random() < 0.25:
+                height = rng.randint(0, height)  # random pits, never walls
+            row.append(ascii_lowercase[height])
+        heightmap.append(row)
+    heightmap[start_row][0], heightmap[start_row][-1] = "S", "E"
+    return "\n".join(map("".join, heightmap))
+
+
+def packet(rng: Random, depth: int = 0) -> list:
+    return [
+        rng.randint(0, 10)
+        if depth >= 4 or rng.random() < 0.6
+        else packet(rng, depth + 1)
+        for _ in range(rng.randint(0, 5))
+    ]
+
+
+def day13(scale: float, rng: Random) -> str:
+    pairs = [
+        f"{packet(rng)}\n{packet(rng)}".replace(" ", "")
+        for _ in range(round(150 * scale))
+    ]
+    return "\n\n".join(pairs)
+
+
+def day14(scale: float, rng: Random) -> str:
+    depth = side(170, scale)
+    scans = list()
+    for _ in range(round(170 * scale)):
+        x, y = rng.randint(500 - depth, 500 + depth), rng.randint(13, depth)
+        path = [(x, y)]
+        for step in range(rng.randint(1, 5)):
+            if step % 2:
+                y = max(13, y + rng.randint(-5, 5))
+            else:
+                x += rng.randint(-5, 5)
+            path.append((x, y))
+        scans.append(" -> ".join(f"{x},{y}" for x, y in path))
+    return "\n".join(scans)
+
+
+def day15(scale: float, rng: Random) -> str:
+    """Sensors (four of them at the corners of the search area) whose coverage
+    leave exactly one position uncovered, i.e. the distress beacon."""
+    size = 4000000
+    px, py = rng.randint(1, size - 1), rng.randint(1, size - 1)
+    sensors = [(0, 0), (size, 0), (0, size), (size, size)]
+    while len(sensors) < round(25 * scale):
+        sx, sy = rng.randint(0, size), rng.randint(0, size)
+        if abs(sx - px) + abs(sy - py) > 2:
+            sensors.append((sx, sy))
+    report = list()
+    for e, (sx, sy) in enumerate(sensors):
+        reach = abs(sx - px) + abs(sy - py) - 1
+        if e >= 4:
+            reach = rng.randint(max(1, reach // 10), reach)
+        dx = min(reach, abs(px - sx))
+        bx = sx + dx * (1 if px > sx else -1)
+        by = sy + (reach - dx) * (1 if py > sy else -1)
+        report.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}")
+    return "\n".join(report)
+
+
+def day16(scale: float, rng: Random) -> str:
+    n_valves = max(16, round(54 * scale))
+    length = 2 if n_valves < 26**2 // 2 else 3
+    labels = ["AA"] + [l.upper() for l in names(n_valves - 1, rng, length, ("aa",))]
+    tunnels = {v: set() for v in labels}
+    for i, v in enumerate(labels[1:], start=1):
+        u = labels[rng.randrange(i)]  # spanning tree: all valves are connected
+        tunnels[u].add(v), tunnels[v].add(u)
+    for _ in range(n_valves // 2):
+        u, v = rng.sample(labels, k=2)
+        tunnels[u].add(v), tunnels[v].add(u)
+    with_flow = set(rng.sample(labels[1:], k=15))
+    report = list()
+    for v in labels:
+        rate = rng.randint(3, 25) if v in with_flow else 0
+        leads = sorted(tunnels[v])
+        if len(leads) == 1:
+            report.append(
+                f"Valve {v} has flow rate={rate}; tunnel leads to valve {leads[0]}"
+            )
+        else:
+            report.append(
+                f"Valve {v} has flow rate={rate}; tunnels lead to valves {', '.join(leads)}"
+            )
+    return "\n".join(report)
+
+
+def day17(scale: float, rng: Random) -> str:
+    return "".join(rng.choices("<>", k=round(10091 * scale)))
+
+
+def day18(scale: float, rng: Random) -> str:
+    length = max(3, round(20 * scale ** (1 / 3)))
+    cubes = rng.sample(range(length**3), k=min(length**3, round(2175 * scale)))
+    return "\n".join(
+        f"{c % length},{c // length % length},{c // length**2}" for c in cubes
+    )
+
+
+def day19(scale: float, rng: Random) -> str:
+    blueprints = list()
+    for bid in range(1, round(30 * scale) + 1):
+        ore, clay, obs_ore, geode_ore = (rng.randint(2, 4) for _ in range(4))
+        obs_clay, geode_obs = rng.randint(5, 20), rng.randint(7, 20)
+        blueprints.append(
+            f"Blueprint {bid}: Each ore robot costs {ore} ore. "
+            f"Each clay robot costs {clay} ore. "
+            f"Each obsidian robot costs {obs_ore} ore and {obs_clay} clay. "
+            f"Each geode robot costs {geode_ore} ore and {geode_obs} obsidian."
+        )
+    return "\n".join(blueprints)
+
+
+def day20(scale: float, rng: Random) -> str:
+    numbers = [
+        rng.choice((-1, 1)) * rng.randint(1, 10000)
+        for _ in range(round(5000 * scale) - 1)
+    ]
+    numbers.insert(rng.randrange(len(numbers) + 1), 0)
+    return "\n".join(map(str, numbers))
+
+
+HUMAN = "humn"
+
+
+def day21(scale: float, rng: Random) -> str:
+    n_leaves = round(1377 * scale)
+    labels = iter(names(2 * n_leaves, rng, reserved=("root", "humn")))
+    jobs = list()
+
+    def monkey(label: str, leaves: int, with_human: bool) -> tuple[int, bool]:
+        """Yell a number, or wait for two other monkeys. Returns (value, humn in subtree)"""
+        if leaves == 1:
+            value = rng.randint(1, 20)
+            jobs.append(f"{label}: {value}")
+            return value, with_human
+        split = rng.randint(1, leaves - 1)
+        human_left = with_human and rng.random() < 0.5
+        left, right = (next(labels), next(labels))
+        if with_human:
+            left = HUMAN if human_left and split == 1 else left
+            right = HUMAN if not human_left and leaves - split == 1 else right
+        lvalue, _ = monkey(left, split, human_left)
+        rvalue, _ = monkey(right, leaves - split, with_human and not human_left)
+        op = rng.choices("+-*/", weights=(35, 35, 15, 15))[0]
+        if op == "*" and 0 in (lvalue, rvalue):
+            op = "+"
+        if op == "/" and (rvalue == 0 or (with_human and not human_left)):
+            op = "-"
+        match op:
+            case "+":
+                value = lvalue + rvalue
+            case "-":
+                value = lvalue - rvalue
+            case "*":
+                value = lvalue * rvalue
+            case "/":
+                value = lvalue // rvalue
+        jobs.append(f"{label}: {left} {op} {right}")
+        return value, with_human
+
+    monkey("root", n_leaves, with_human=True)
+    return "\n".join(reversed(jobs))
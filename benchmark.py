@@ -0,0 +1,179 @@
+""" -- Advent of Code --
+Benchmark suite: solvers against synthetic inputs of increasing size.
+
+Puzzle inputs are all pretty small, so the only way to find out which
+solvers fall apart on bigger inputs is to make some up.
+Each year has its own `generators.py` module, with one `dayNN(scale, rng)`
+generator per puzzle, returning an input (in the very same format)
+`scale` times the size of the original one.
+
+Notes on the Implementation:
+- Each (day, part, scale) is solved in a fresh process, reusing `runner.run`,
+  so wall time, CPU time and peak RSS are measured exactly as in `runner.py`.
+- Each run is given at most `--timeout` seconds. As soon as a part times out
+  (or fails, e.g. `RecursionError`) on a scale, larger scales are skipped.
+- Throughput is measured in KiB of input per second, whereas the scaling
+  _order_ is the slope of `log(time)` over `log(size)` w.r.t the previous scale:
+  ~1 means linear, ~2 quadratic, and so on.
+
+Usage:
+    python benchmark.py                                # all puzzles
+    python benchmark.py --year 2021 --day 15 --scales 1 10 100 1000
+    python benchmark.py --timeout 30 --output bench.json
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from functools import cache
+from math import log
+from multiprocessing import TimeoutError, get_context
+from pathlib import Path
+from random import Random
+from types import ModuleType
+from typing import Optional
+
+from runner import ROOT, Job, Report, discover, run
+
+SCALES = (1, 10, 100, 1000)
+
+
+@dataclass
+class Measure:
+    year: str
+    day: str
+    part: int
+    scale: float
+    size: int  # bytes
+    wall_time: Optional[float] = None
+    cpu_time: Optional[float] = None
+    peak_rss: Optional[int] = None
+    status: str = "ok"  # ok | timeout | error
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """KiB of input per second"""
+        if self.status != "ok" or not self.wall_time:
+            return None
+        return self.size / 1024 / self.wall_time
+
+
+@cache
+def generators(year: str) -> ModuleType:
+    filepath = ROOT / f"aoc{year}" / "generators.py"
+    spec = importlib.util.spec_from_file_location(f"aoc{year}_generators", filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(job: Job, filepath: Path, timeout: float) -> Optional[Report]:
+    """Run the job in a fresh process, killing it after timeout seconds."""
+    with get_context("spawn").Pool(processes=1, maxtasksperchild=1) as pool:
+        result = pool.apply_async(run, (job, filepath))
+        try:
+            return result.get(timeout)
+        except TimeoutError:
+            return None
+
+
+def benchmark(
+    year: str, day: str, scales: list[float], timeout: float, seed: int
+) -> list[Measure]:
+    generate = getattr(generators(year), f"day{day}", None)
+    if generate is None:
+        return []
+    alive = set(generators(year).PARTS.get(day, (1, 2)))
+    measures = list()
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / Job(year, day, 1).input_file.name
+        for scale in scales:
+            if not alive:
+                break  # all parts fell apart already
+            filepath.write_text(generate(scale, Random(seed)))
+            for part in sorted(alive):
+                m = Measure(year, day, part, scale, size=filepath.stat().st_size)
+                report = measure(Job(year, day, part), filepath, timeout)
+                if report is None:
+                    m.status = "timeout"
+                elif report.error:
+                    m.status = "error"
+                    print(report.error, file=sys.stderr)
+                else:
+                    m.wall_time, m.cpu_time = report.wall_time, report.cpu_time
+                    m.peak_rss = report.peak_rss
+                if m.status != "ok":
+                    alive.discard(part)
+                previous = next((p for p in measures[::-1] if p.part == part), None)
+                measures.append(m)
+                print(row(m, previous))
+    return measures
+
+
+def order(m: Measure, previous: Optional[Measure]) -> Optional[float]:
+    """Empirical order of growth w.r.t. previous measure (if any) of the same part"""
+    if (
+        previous is None
+        or m.status != "ok"
+        or previous.status != "ok"
+        or m.size == previous.size
+        or not (m.wall_time and previous.wall_time)
+    ):
+        return None
+    return log(m.wall_time / previous.wall_time) / log(m.size / previous.size)
+
+
+HEADER = (
+    f"{'Year':<5}{'Day':<4}{'Part':<5}{'Scale':>7}{'Size(KiB)':>11}{'Wall(s)':>10}"
+    f"{'CPU(s)':>10}{'RSS(MiB)':>10}{'KiB/s':>11}{'Order':>7}"
+)
+
+
+def row(m: Measure, previous: Optional[Measure] = None) -> str:
+    if m.status != "ok":
+        timings = f"{m.status.upper():>51}"
+    else:
+        rss = f"{m.peak_rss / 2**20:.1f}" if m.peak_rss else "n/a"
+        slope = order(m, previous)
+        slope = f"{slope:.2f}" if slope is not None else ""
+        timings = (
+            f"{m.wall_time:>10.3f}{m.cpu_time:>10.3f}{rss:>10}"
+            f"{m.throughput:>11.1f}{slope:>7}"
+        )
+    return (
+        f"{m.year:<5}{m.day:<4}{m.part:<5}{m.scale:>7g}"
+        f"{m.size / 1024:>11.1f}{timings}"
+    )
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", nargs="*", help="e.g. 2021 2022 (default: all)")
+    parser.add_argument("--day", nargs="*", help="e.g. 01 16 (default: all)")
+    parser.add_argument("--scales", nargs="*", type=float, default=SCALES)
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="seconds per (part, scale)"
+    )
+    parser.add_argument("--seed", type=int, default=2022)
+    parser.add_argument("--output", type=Path, help="save all measures as JSON")
+    args = parser.parse_args(argv)
+    days = [d.zfill(2) for d in args.day] if args.day else None
+
+    print("=*=*=*=*=*=*=*=*=*=*=*= Advent of Code Benchmarks =*=*=*=*=*=*=*=*=*=*=*=")
+    print(HEADER)
+    print("-" * len(HEADER))
+    measures = list()
+    for year, day in discover(args.year, days):
+        measures += benchmark(year, day, sorted(args.scales), args.timeout, args.seed)
+
+    if args.output:
+        records = [dict(asdict(m), throughput=m.throughput) for m in measures]
+        args.output.write_text(json.dumps(records, indent=2))
+    return int(any(m.status == "error" for m in measures))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Test suite configuration shared by all the puzzles.
+
+Tests on game input (i.e. `test_part*_on_game_input`) go through the persistent
+answer cache (see `answers.py`): the part function is wrapped so that, if neither
+`input.NN` nor the solver code has changed, the (cached) answer is returned
+straight away. The test assertion is still checked, against the cached answer.
+"""
+
+import re
+import sys
+from functools import wraps
+
+from pytest import fixture
+
+import answers
+
+GAME_INPUT_TEST = re.compile(r"test_part(?P<part>\d)_on_game_input")
+
+
+def cached(solver, year: str, day: str, part: int, input_file, module):
+    digests = (answers.input_digest(input_file), answers.solver_digest(module))
+
+    @wraps(solver)
+    def wrapper(*args, **kwargs):
+        # the first argument is the game input (already hashed), if positional
+        extras = args[1:], sorted(kwargs.items())
+        extras = repr(extras) if any(extras) else ""
+        key = answers.cache_key(year, day, part, *digests, extras=extras)
+        with answers.AnswerCache() as cache:
+            if (answer := cache.get(key)) is not answers.MISS:
+                return answer
+            answer = solver(*args, **kwargs)
+            cache.put(key, answer)
+        return answer
+
+    return wrapper
+
+
+@fixture(autouse=True)
+def answer_cache(request, monkeypatch):
+    match = GAME_INPUT_TEST.fullmatch(request.node.originalname)
+    if not answers.enabled() or match is None:
+        return
+    folder = request.path.parent
+    year, day = folder.parent.name[3:], folder.name[3:]
+    input_file = folder / f"input.{day}"
+    if not input_file.exists():
+        input_file = folder / "input.txt"
+    part = int(match["part"])
+    solver = getattr(request.module, f"part{part}", None)
+    if solver is None:
+        return
+    module = sys.modules[solver.__module__]
+    monkeypatch.setattr(
+        request.module,
+        f"part{part}",
+        cached(solver, year, day, part, input_file, module),
+    )
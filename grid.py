@@ -0,0 +1,80 @@
+""" -- Advent of Code --
+Compact grid shared by the puzzles working on (rectangular) maps of small integers
+(e.g. 2021 Day 09, 11 and 2022 Day 08, 12).
+
+Notes on the Implementation:
+Cells are stored row-major in a single flat
+[`array`](https://docs.python.org/3/library/array.html) of signed bytes,
+rather than a `dict` of `(row, col)` coordinates, or a list of lists.
+Each cell is then identified by its _flat index_, and its neighbours are
+simply `index + offset`, using the precomputed offset tables `offsets4`
+(north, west, east, south) and `offsets8` (diagonals included).
+
+The grid is surrounded by `pad` rows and columns of `border` cells:
+neighbours of cells on the edges are therefore always within the array,
+and no bound checking is ever required. Choosing the value of the border
+is up to the puzzle: e.g. a wall (`9` for Smoke Basin), or a sentinel
+never found in the input (the default, `-1`).
+"""
+
+from array import array
+from typing import Iterable, Iterator
+
+
+class Grid:
+    def __init__(
+        self,
+        nrows: int,
+        ncols: int,
+        border: int = -1,
+        pad: int = 1,
+        typecode: str = "b",
+    ) -> None:
+        self.nrows, self.ncols = nrows, ncols
+        self.border, self.pad = border, pad
+        self.width = ncols + 2 * pad  # i.e. the stride of a row
+        self.cells = array(typecode, [border]) * (self.width * (nrows + 2 * pad))
+        w = self.width
+        self.offsets4 = (-w, -1, 1, w)
+        self.offsets8 = (-w - 1, -w, -w + 1, -1, 1, w - 1, w, w + 1)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[int]], **kwargs) -> "Grid":
+        rows = [array(kwargs.get("typecode", "b"), row) for row in rows]
+        grid = cls(len(rows), len(rows[0]), **kwargs)
+        for r, row in enumerate(rows):
+            if len(row) != grid.ncols:
+                raise ValueError(
+                    f"Row {r} has {len(row)} cells, whereas {grid.ncols} expected"
+                )
+            grid.cells[grid.index(r, 0) : grid.index(r, grid.ncols)] = row
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.pad) * self.width + col + self.pad
+
+    def coords(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.width)
+        return row - self.pad, col - self.pad
+
+    def row(self, row: int) -> array:
+        start = self.index(row, 0)
+        return self.cells[start : start + self.ncols]
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __iter__(self) -> Iterator[int]:
+        """Flat indices of all the cells within the grid (padding excluded)"""
+        for r in range(self.nrows):
+            start = self.index(r, 0)
+            yield from range(start, start + self.ncols)
+
+    def __len__(self) -> int:
+        return self.nrows * self.ncols
+
+    def __repr__(self) -> str:
+        return f"Grid({self.nrows}x{self.ncols}, border={self.border}, pad={self.pad})"
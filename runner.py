@@ -0,0 +1,297 @@
+""" -- Advent of Code --
+Unified runner for all the puzzles in the repository.
+
+Every `aocYYYY/dayNN/puzzle.py` is a standalone script, so timing a whole year
+used to mean launching one interpreter per day, by hand.
+This runner discovers each day's `load` (or `parse_input`), `part1` and `part2`,
+and solves every part in a pool of worker processes.
+
+Notes on the Implementation:
+- Each part is a separate job, executed in a _fresh_ (spawned) process
+  (i.e. `max_tasks_per_child=1`): this way the peak RSS (see `peak_rss`)
+  refers to that part only, and no `functools.cache` leaks from one part to the other.
+- Jobs are scheduled _longest expected job first_: expected times are the wall
+  times recorded in the previous run (see `TIMINGS_FILE`). Jobs never timed
+  before go first, as they could be the slow ones; ties are broken by input size.
+  This way the slow days (e.g. 2022 Day 16, 17, 19) do not serialise
+  everything else behind them.
+- Input is fed to each part as the `__main__` block of each puzzle would do
+  (see `read_input`).
+- Answers are looked up in the persistent cache of `answers.py` first, unless
+  `--no-cache` is given: cached parts are not timed (nor solved) at all.
+
+Usage:
+    python runner.py                        # all years, all days
+    python runner.py --year 2022 --day 16 19
+    python runner.py --part 2 --workers 4
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from inspect import Parameter, signature
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter, process_time
+from types import ModuleType
+from typing import Any, Optional
+
+import answers
+
+try:
+    import resource
+except ImportError:  # e.g. Windows
+    resource = None
+
+ROOT = Path(__file__).parent
+TIMINGS_FILE = ROOT / ".timings.json"
+
+# Days whose parts expect the values returned by `load` in a different order
+REORDER = {("2021", "20"): (1, 0)}
+
+
+@dataclass(frozen=True, order=True)
+class Job:
+    year: str
+    day: str
+    part: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day}/{self.part}"
+
+    @property
+    def folder(self) -> Path:
+        return ROOT / f"aoc{self.year}" / f"day{self.day}"
+
+    @property
+    def input_file(self) -> Path:
+        filepath = self.folder / f"input.{self.day}"
+        return filepath if filepath.exists() else self.folder / "input.txt"
+
+
+@dataclass
+class Report:
+    job: Job
+    answer: Any = None
+    load_time: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss: Optional[int] = None  # bytes
+    output: str = ""
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def discover(years: list[str] = None, days: list[str] = None) -> list[tuple[str, str]]:
+    puzzles = list()
+    for folder in sorted(ROOT.glob("aoc*/day*")):
+        if not (folder / "puzzle.py").exists():
+            continue
+        year, day = folder.parent.name[3:], folder.name[3:]
+        if (years and year not in years) or (days and day not in days):
+            continue
+        puzzles.append((year, day))
+    return puzzles
+
+
+def import_puzzle(folder: Path, name: str) -> ModuleType:
+    """Import `puzzle.py` in folder under a unique module name (they are all called `puzzle`!)"""
+    sys.path.insert(0, str(folder))
+    spec = importlib.util.spec_from_file_location(name, folder / "puzzle.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_input(module: ModuleType, filepath: Path) -> Any:
+    """Load puzzle input the same way each `__main__` block does it."""
+    text = filepath.read_text()
+    if hasattr(module, "load"):
+        param = next(iter(signature(module.load).parameters.values()))
+        if param.name == "filepath":
+            return module.load(filepath=filepath)
+        if param.annotation is str:
+            return module.load(text.strip())
+        return module.load(text.strip().splitlines())
+    if hasattr(module, "parse_input"):
+        return module.parse_input(text.split("\n"))
+    return text.strip()  # e.g. 2021 Day 06 works on the raw line
+
+
+def arguments(solver, data: Any, reorder: tuple[int] = None) -> tuple:
+    required = [
+        p for p in signature(solver).parameters.values() if p.default is Parameter.empty
+    ]
+    if len(required) > 1 and isinstance(data, tuple):
+        return tuple(data[i] for i in reorder) if reorder else data
+    return (data,)
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process, in bytes.
+    On Linux, `ru_maxrss` survives `exec`, i.e. spawned processes would inherit the
+    peak of their parent: `VmHWM` is used instead, whenever available."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # Linux reports KiB
+
+
+def run(job: Job, filepath: Path = None, use_cache: bool = False) -> Report:
+    report = Report(job=job)
+    output = io.StringIO()
+    filepath = filepath or job.input_file
+    try:
+        with redirect_stdout(output):
+            module = import_puzzle(job.folder, name=f"aoc{job.year}_day{job.day}")
+            if use_cache:
+                key = answers.cache_key(
+                    job.year,
+                    job.day,
+                    job.part,
+                    answers.input_digest(filepath),
+                    answers.solver_digest(module),
+                )
+                with answers.AnswerCache() as cache:
+                    answer = cache.get(key)
+                if answer is not answers.MISS:
+                    report.answer, report.cached = answer, True
+                    return report
+            start = perf_counter()
+            data = read_input(module, filepath)
+            report.load_time = perf_counter() - start
+            solver = getattr(module, f"part{job.part}")
+            args = arguments(solver, data, REORDER.get((job.year, job.day)))
+            wall, cpu = perf_counter(), process_time()
+            report.answer = solver(*args)
+            report.wall_time = perf_counter() - wall
+            report.cpu_time = process_time() - cpu
+        if use_cache:
+            with answers.AnswerCache() as cache:
+                cache.put(key, report.answer)
+    except Exception:
+        report.error = traceback.format_exc(limit=-1).strip()
+    finally:
+        report.output = output.getvalue()
+        report.peak_rss = peak_rss()
+    return report
+
+
+def load_timings() -> dict[str, float]:
+    try:
+        return json.loads(TIMINGS_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return dict()
+
+
+def save_timings(timings: dict[str, float], reports: list[Report]) -> None:
+    timings.update(
+        {r.job.key: r.wall_time for r in reports if not (r.error or r.cached)}
+    )
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def schedule(jobs: list[Job], timings: dict[str, float]) -> list[Job]:
+    """Longest expected job first; jobs never timed before go first."""
+
+    def expected(job: Job) -> tuple[float, int]:
+        return timings.get(job.key, float("inf")), job.input_file.stat().st_size
+
+    return sorted(jobs, key=expected, reverse=True)
+
+
+def solve_all(
+    jobs: list[Job], workers: int = None, use_cache: bool = True
+) -> list[Report]:
+    reports = list()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn"), max_tasks_per_child=1
+    ) as pool:
+        futures = [pool.submit(run, job, None, use_cache) for job in jobs]
+        for future in as_completed(futures):
+            reports.append(future.result())
+    return sorted(reports, key=lambda r: r.job)
+
+
+def summary(reports: list[Report], verbose: bool = False) -> str:
+    rows = [
+        f"{'Year':<5}{'Day':<4}{'Part':<5}{'Answer':>20}{'Load(s)':>10}"
+        f"{'Wall(s)':>10}{'CPU(s)':>10}{'RSS(MiB)':>10}",
+        "-" * 74,
+    ]
+    for r in reports:
+        answer = "ERROR" if r.error else str(r.answer).strip()
+        if r.cached:
+            answer = f"(cached) {answer}"
+        rss = f"{r.peak_rss / 2**20:.1f}" if r.peak_rss else "n/a"
+        rows.append(
+            f"{r.job.year:<5}{r.job.day:<4}{r.job.part:<5}"
+            f"{answer.splitlines()[0] if answer else answer:>20}"
+            f"{r.load_time:>10.3f}{r.wall_time:>10.3f}{r.cpu_time:>10.3f}{rss:>10}"
+        )
+        if r.error:
+            rows.extend(f"     {line}" for line in r.error.splitlines())
+        if verbose and r.output:
+            rows.extend(f"     {line}" for line in r.output.splitlines())
+    rows.append("-" * 74)
+    rows.append(
+        f"{'Total':<34}{sum(r.load_time for r in reports):>10.3f}"
+        f"{sum(r.wall_time for r in reports):>10.3f}"
+        f"{sum(r.cpu_time for r in reports):>10.3f}"
+    )
+    return "\n".join(rows)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", nargs="*", help="e.g. 2021 2022 (default: all)")
+    parser.add_argument("--day", nargs="*", help="e.g. 01 16 (default: all)")
+    parser.add_argument("--part", nargs="*", type=int, choices=(1, 2), default=(1, 2))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show what parts print"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="solve even if answers are cached"
+    )
+    args = parser.parse_args(argv)
+    days = [d.zfill(2) for d in args.day] if args.day else None
+
+    timings = load_timings()
+    jobs = [
+        Job(year, day, part)
+        for year, day in discover(args.year, days)
+        for part in args.part
+    ]
+    start = perf_counter()
+    reports = solve_all(
+        schedule(jobs, timings),
+        workers=args.workers,
+        use_cache=answers.enabled() and not args.no_cache,
+    )
+    elapsed = perf_counter() - start
+    save_timings(timings, reports)
+
+    print("=*=*=*=*=*=*=*=*=*=*=*=*= Advent of Code =*=*=*=*=*=*=*=*=*=*=*=*=*=")
+    print(summary(reports, verbose=args.verbose))
+    print(f"Elapsed (with {args.workers} workers): {elapsed:.3f}s")
+    return int(any(r.error for r in reports))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
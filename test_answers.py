@@ -0,0 +1,117 @@
+"""Test Module for the persistent answer cache (see `answers.py`)"""
+
+import importlib.util
+import sys
+from itertools import count
+from pathlib import Path
+
+from pytest import fixture
+
+import answers
+from answers import MISS, AnswerCache
+
+ROOT = Path(__file__).parent
+
+SHARED = """def share():
+    return 42
+"""
+
+HELPER = """def helper():
+    from shared import share  # imported lazily
+
+    return share()
+"""
+
+PUZZLE = """import helper
+
+
+def part1(data):
+    return helper.helper()
+"""
+
+
+@fixture(scope="function")
+def cache(tmp_path, monkeypatch):
+    clock = count()
+    monkeypatch.setattr(answers, "time", lambda: next(clock))
+    with AnswerCache(filepath=tmp_path / "answers.sqlite", max_entries=2) as cache:
+        yield cache
+
+
+@fixture(scope="function")
+def solver(tmp_path, monkeypatch):
+    """Puzzle module using a shared module only through another local module"""
+    monkeypatch.setattr(answers, "ROOT", tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "shared.py").write_text(SHARED)
+    (tmp_path / "helper.py").write_text(HELPER)
+    (tmp_path / "day01").mkdir()
+    (tmp_path / "day01" / "puzzle.py").write_text(PUZZLE)
+    spec = importlib.util.spec_from_file_location(
+        "test_answers_puzzle", tmp_path / "day01" / "puzzle.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    for name in ("helper", "shared"):
+        sys.modules.pop(name, None)
+
+
+class TestAnswerCache:
+    def test_miss_and_hit(self, cache):
+        assert cache.get("key") is MISS
+        cache.put("key", 42)
+        assert cache.get("key") == 42
+
+    def test_none_answer(self, cache):
+        cache.put("key", None)
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self, cache):
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # b is now the least recently used
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is MISS
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+class TestCacheKey:
+    def key(self, input_file: Path, module) -> str:
+        digests = answers.input_digest(input_file), answers.solver_digest(module)
+        return answers.cache_key("2022", "01", 1, *digests)
+
+    def test_key_changes_with_input(self, tmp_path, solver):
+        input_file = tmp_path / "input.01"
+        input_file.write_bytes(b"1\n2\n")
+        key = self.key(input_file, solver)
+        assert self.key(input_file, solver) == key
+        input_file.write_bytes(b"1\n3\n")
+        assert self.key(input_file, solver) != key
+
+    def test_key_changes_with_puzzle(self, tmp_path, solver):
+        input_file = tmp_path / "input.01"
+        input_file.write_bytes(b"1\n2\n")
+        key = self.key(input_file, solver)
+        (tmp_path / "day01" / "puzzle.py").write_text(PUZZLE + "\n# edited\n")
+        assert self.key(input_file, solver) != key
+
+    def test_key_changes_with_shared_module(self, tmp_path, solver):
+        input_file = tmp_path / "input.01"
+        input_file.write_bytes(b"1\n2\n")
+        assert answers.local_modules(solver) == {
+            tmp_path / "day01" / "puzzle.py",
+            tmp_path / "helper.py",
+            tmp_path / "shared.py",
+        }
+        key = self.key(input_file, solver)
+        (tmp_path / "shared.py").write_text(SHARED.replace("42", "24"))
+        assert self.key(input_file, solver) != key
+
+    def test_grid_is_a_local_module(self):
+        filepath = ROOT / "aoc2022" / "day08" / "puzzle.py"
+        spec = importlib.util.spec_from_file_location("test_answers_day08", filepath)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert answers.local_modules(module) == {filepath, ROOT / "grid.py"}
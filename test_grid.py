@@ -0,0 +1,25 @@
+"""Test Module for the shared Grid (see `grid.py`)"""
+
+from pytest import raises
+
+from grid import Grid
+
+
+class TestGrid:
+    def test_from_rows(self):
+        grid = Grid.from_rows([[1, 2, 3], [4, 5, 6]])
+        assert (grid.nrows, grid.ncols, len(grid.cells)) == (2, 3, 20)
+        assert [grid[i] for i in grid] == [1, 2, 3, 4, 5, 6]
+        assert grid.coords(grid.index(1, 2)) == (1, 2)
+        assert sorted(grid[grid.index(0, 1) + o] for o in grid.offsets4) == [
+            -1,
+            1,
+            3,
+            5,
+        ]
+
+    def test_ragged_rows(self):
+        with raises(ValueError):
+            Grid.from_rows([[1, 2, 3], [4, 5], [7, 8, 9]])
+        with raises(ValueError):
+            Grid.from_rows([[1, 2, 3], []])